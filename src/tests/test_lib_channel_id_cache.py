@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# See LICENSE file for copyright and license details.
+# TUM CS Bot - https://github.com/ro-i/tumcsbot
+
+import asyncio
+import unittest
+
+from unittest.mock import AsyncMock, patch
+from typing import Any
+
+from .test_client import asSync, Client
+
+
+def rendered(channel_id: int) -> dict[str, Any]:
+    return {
+        "result": "success",
+        "rendered": f'<p><a class="stream" data-stream-id="{channel_id}" href="/#narrow/stream/{channel_id}-test">#test</a></p>',
+    }
+
+
+class ChannelIdCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._client = Client()
+
+    @asSync
+    async def test_hit_is_cached(self) -> None:
+        render = AsyncMock(return_value=rendered(42))
+        with patch.object(Client, "render_message", render):
+            self.assertEqual(await self._client.get_channel_id_by_name("#**test**"), 42)
+            self.assertEqual(await self._client.get_channel_id_by_name("#**test**"), 42)
+        self.assertEqual(render.await_count, 1)
+
+    @asSync
+    async def test_miss_is_not_cached(self) -> None:
+        render = AsyncMock(return_value={"result": "success", "rendered": "<p>#test</p>"})
+        with patch.object(Client, "render_message", render):
+            self.assertIsNone(await self._client.get_channel_id_by_name("#**test**"))
+            self.assertIsNone(await self._client.get_channel_id_by_name("#**test**"))
+        self.assertEqual(render.await_count, 2)
+
+    @asSync
+    async def test_concurrent_lookups_share_request(self) -> None:
+        render = AsyncMock(return_value={"result": "success", "rendered": "<p>#test</p>"})
+        with patch.object(Client, "render_message", render):
+            results = await asyncio.gather(
+                *(self._client.get_channel_id_by_name("#**test**") for _ in range(3))
+            )
+            self.assertEqual(results, [None, None, None])
+            self.assertEqual(render.await_count, 1)
+            # the finished lookup is not shared with later callers
+            await self._client.get_channel_id_by_name("#**test**")
+        self.assertEqual(render.await_count, 2)
+
+    @asSync
+    async def test_expired_entry_is_refreshed(self) -> None:
+        render = AsyncMock(return_value=rendered(42))
+        with patch.object(Client, "render_message", render), patch.object(
+            Client, "CHANNEL_ID_CACHE_TTL", 0.0
+        ):
+            await self._client.get_channel_id_by_name("#**test**")
+            await self._client.get_channel_id_by_name("#**test**")
+        self.assertEqual(render.await_count, 2)
+
+    @asSync
+    async def test_delete_invalidates(self) -> None:
+        render = AsyncMock(return_value=rendered(42))
+        endpoint = AsyncMock(return_value={"result": "success"})
+        with patch.object(Client, "render_message", render), patch.object(
+            Client, "call_endpoint", endpoint
+        ):
+            await self._client.get_channel_id_by_name("#**test**")
+            await self._client.delete_channel(42)
+            await self._client.get_channel_id_by_name("#**test**")
+        self.assertEqual(render.await_count, 2)
+
+    @asSync
+    async def test_rename_invalidates(self) -> None:
+        render = AsyncMock(return_value=rendered(42))
+        endpoint = AsyncMock(return_value={"result": "success"})
+        with patch.object(Client, "render_message", render), patch.object(
+            Client, "call_endpoint", endpoint
+        ):
+            await self._client.get_channel_id_by_name("#**test**")
+            await self._client.update_channel({"stream_id": 42, "description": "x"})
+            await self._client.get_channel_id_by_name("#**test**")
+            self.assertEqual(render.await_count, 1)
+            await self._client.update_channel({"stream_id": 42, "new_name": "other"})
+            await self._client.get_channel_id_by_name("#**test**")
+        self.assertEqual(render.await_count, 2)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# See LICENSE file for copyright and license details.
+# TUM CS Bot - https://github.com/ro-i/tumcsbot
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy import text
+
+from tumcsbot.lib.db import DB
+from tumcsbot.plugins.channelgroup import ChannelGroup, Channelgroup
+from tumcsbot.plugins.usergroup import UserGroup
+
+
+class EmojiCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp: str = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        DB.set_path(os.path.join(tmp, "test.db"))
+        DB.create_tables()
+
+        with DB.session() as session:
+            group = UserGroup(GroupName="ugrp_strgrpcg")
+            session.add(group)
+            session.flush()
+            session.add(
+                ChannelGroup(
+                    ChannelGroupId="cg", ChannelGroupEmote="cat", UserGroupId=group.GroupId
+                )
+            )
+            # committing the new ChannelGroup also drops entries of earlier tests
+            session.commit()
+
+    def tearDown(self) -> None:
+        DB.engine().dispose()
+
+    @staticmethod
+    def _rename_emote_behind_orm(emote: str) -> None:
+        # plain connections do not go through the session events
+        with DB.engine().begin() as conn:
+            conn.execute(
+                text("UPDATE ChannelGroups SET ChannelGroupEmote = :emote"),
+                {"emote": emote},
+            )
+
+    def test_hit_is_cached(self) -> None:
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("cat"), "cg")
+        self._rename_emote_behind_orm("dog")
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("cat"), "cg")
+
+    def test_orm_insert_invalidates(self) -> None:
+        self.assertIsNone(Channelgroup.get_group_id_from_emoji_event("dog"))
+
+        with DB.session() as session:
+            group = UserGroup(GroupName="ugrp_strgrpdg")
+            session.add(group)
+            session.flush()
+            session.add(
+                ChannelGroup(
+                    ChannelGroupId="dg", ChannelGroupEmote="dog", UserGroupId=group.GroupId
+                )
+            )
+            session.commit()
+
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("dog"), "dg")
+
+    def test_bulk_update_invalidates(self) -> None:
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("cat"), "cg")
+
+        with DB.session() as session:
+            session.query(ChannelGroup).filter(
+                ChannelGroup.ChannelGroupId == "cg"
+            ).update({ChannelGroup.ChannelGroupEmote: "dog"})
+            session.commit()
+
+        self.assertIsNone(Channelgroup.get_group_id_from_emoji_event("cat"))
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("dog"), "cg")
+
+    def test_bulk_delete_of_usergroup_invalidates(self) -> None:
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("cat"), "cg")
+
+        # the ChannelGroup goes with its UserGroup (ON DELETE CASCADE)
+        with DB.session() as session:
+            session.query(UserGroup).filter(
+                UserGroup.GroupName == "ugrp_strgrpcg"
+            ).delete()
+            session.commit()
+
+        self.assertIsNone(Channelgroup.get_group_id_from_emoji_event("cat"))
+
+    def test_rollback_does_not_invalidate(self) -> None:
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("cat"), "cg")
+
+        with DB.session() as session:
+            session.query(ChannelGroup).filter(
+                ChannelGroup.ChannelGroupId == "cg"
+            ).update({ChannelGroup.ChannelGroupEmote: "dog"})
+            session.rollback()
+            # the rolled back update must not be picked up by a later commit
+            session.commit()
+
+        self._rename_emote_behind_orm("dog")
+        self.assertEqual(Channelgroup.get_group_id_from_emoji_event("cat"), "cg")
@@ -13,13 +13,16 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import cached_property
 import logging
 import re
 import json
+import time
 from collections.abc import Iterable as IterableClass
 from typing import AsyncGenerator, Callable, cast, Any, IO, Iterable, final, Coroutine
 from urllib.parse import quote
 
+from requests.adapters import HTTPAdapter
 from sqlalchemy import Boolean, Column, String
 
 from zulip import Client as ZulipClient
@@ -137,6 +140,55 @@ class PlublicChannels(TableBase):  # type: ignore
 TTL: int = 10
 
 
+class ChannelIdCache:
+    """Channel ids resolved by name, see AsyncClient.get_channel_id_by_name.
+
+    Found ids are kept for `ttl` seconds. Concurrent lookups of the same
+    name share one request.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl: float = ttl
+        # channel name -> (time of lookup, channel id)
+        self._ids: dict[str, tuple[float, int]] = {}
+        # channel name -> lookup in flight
+        self._pending: dict[str, asyncio.Task[int | None]] = {}
+
+    async def get(
+        self, channel_name: str, lookup: Callable[[str], Coroutine[Any, Any, int | None]]
+    ) -> int | None:
+        """Get the cached id or resolve it with the given coroutine.
+
+        Misses are not cached, as the channel may be created right after.
+        """
+        cached: tuple[float, int] | None = self._ids.get(channel_name)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+            del self._ids[channel_name]
+
+        pending: asyncio.Task[int | None] | None = self._pending.get(channel_name)
+        if pending is None:
+            pending = asyncio.create_task(self._resolve(channel_name, lookup))
+            self._pending[channel_name] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(channel_name, None))
+        # a cancelled caller must not cancel the lookup the others wait for
+        return await asyncio.shield(pending)
+
+    async def _resolve(
+        self, channel_name: str, lookup: Callable[[str], Coroutine[Any, Any, int | None]]
+    ) -> int | None:
+        channel_id: int | None = await lookup(channel_name)
+        if channel_id is not None:
+            self._ids[channel_name] = (time.monotonic(), channel_id)
+        return channel_id
+
+    def forget(self, channel_id: int) -> None:
+        """Drop all cached names resolving to the given channel id."""
+        for name in [name for name, (_, cid) in self._ids.items() if cid == channel_id]:
+            del self._ids[name]
+
+
 class AsyncClient:
     """Wrapper around zulip.Client.
 
@@ -171,6 +223,11 @@ class AsyncClient:
                               channel.
     """
 
+    # seconds a resolved channel id is reused without asking the server again
+    CHANNEL_ID_CACHE_TTL: float = 30.0
+    # worker threads issuing requests, each one keeps an open connection
+    MAX_CONCURRENT_REQUESTS: int = 32
+
     def __init__(
         self, plugin_context: PluginContext, *args: Any, **kwargs: Any
     ) -> None:
@@ -181,9 +238,23 @@ class AsyncClient:
         kwargs["config_file"] = kwargs.get("config_file", plugin_context.zuliprc)
 
         self._client: ZulipClient = ZulipClient(*args, **kwargs)
-        self._executor = ThreadPoolExecutor()
+        self._executor = ThreadPoolExecutor(
+            max_workers=AsyncClient.MAX_CONCURRENT_REQUESTS
+        )
+        # The underlying requests session already reuses connections, but its
+        # default pool keeps only 10 of them. Size it to the executor so that
+        # concurrent calls do not discard connections and redo the handshake.
+        self._client.ensure_session()
+        adapter = HTTPAdapter(pool_maxsize=AsyncClient.MAX_CONCURRENT_REQUESTS)
+        if self._client.session is not None:
+            self._client.session.mount("https://", adapter)
+            self._client.session.mount("http://", adapter)
         self.verbose: bool = plugin_context.logging_level <= logging.DEBUG
 
+    @cached_property
+    def channel_ids(self) -> ChannelIdCache:
+        return ChannelIdCache(self.CHANNEL_ID_CACHE_TTL)
+
     @property
     def base_url(self) -> str:
         return self._client.base_url
@@ -664,6 +735,7 @@ class AsyncClient:
         )
 
     async def delete_channel(self, channel_id: int) -> dict[str, Any]:
+        self.channel_ids.forget(channel_id)
         return await self.call_endpoint(
             url=f"streams/{channel_id}",
             method="DELETE",
@@ -929,7 +1001,50 @@ class AsyncClient:
             return None
         return int(match.groupdict()["id"])
 
+    async def get_user_ids_by_names(self, usernames: list[str]) -> list[int | None]:
+        """Get the ids of several users by their mentions at once.
+
+        All mentions are rendered in one request, each in a paragraph of
+        its own, so that the ids can be assigned back to the names.
+        Return the ids in the order of the names, None for unknown users.
+        """
+        if not usernames:
+            return []
+
+        request = {
+            "content": "\n\n".join(username.strip() for username in usernames),
+        }
+
+        result = await self.render_message(request)
+        if result["result"] != "success":
+            return [None] * len(usernames)
+
+        paragraphs: list[str] = Regex.PARAGRAPH_PATTERN.findall(result["rendered"])
+        if len(paragraphs) != len(usernames):
+            # the names did not render one per paragraph, look them up one by one
+            return list(
+                await asyncio.gather(
+                    *(self.get_user_id_by_name(username) for username in usernames)
+                )
+            )
+
+        ids: list[int | None] = []
+        for paragraph in paragraphs:
+            match = re.search(Regex.USER_ID_PATTERN, paragraph)
+            ids.append(int(match.groupdict()["id"]) if match else None)
+        return ids
+
     async def get_channel_id_by_name(self, channel_name: str) -> int | None:
+        """Get the id of a channel by its name.
+
+        Found ids are cached for CHANNEL_ID_CACHE_TTL seconds, so that the
+        same channel is not resolved repeatedly while handling one command.
+        Misses are not cached, as the channel may be created right after.
+        Concurrent lookups of the same name share one request.
+        """
+        return await self.channel_ids.get(channel_name, self._lookup_channel_id)
+
+    async def _lookup_channel_id(self, channel_name: str) -> int | None:
         request = {
             "content": channel_name,
         }
@@ -985,6 +1100,8 @@ class AsyncClient:
         """
         See examples/edit-stream for example usage.
         """
+        if "new_name" in channel_data or "name" in channel_data:
+            self.channel_ids.forget(channel_data["stream_id"])
 
         return await self.call_endpoint(
             url=f"streams/{channel_data["stream_id"]}",
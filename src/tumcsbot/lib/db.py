@@ -5,9 +5,8 @@ import yaml
 
 
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import sessionmaker
 import sqlalchemy.orm
 
 from tumcsbot.lib.utils import get_classes_from_path
@@ -39,6 +38,20 @@ class DB:
             raise ValueError("path to database is not absolute")
         DB._path = path
         DB._engine = create_engine("sqlite:///" + path, max_overflow=100, pool_timeout=3600)
+        event.listen(DB._engine, "connect", DB._on_connect)
+
+    @staticmethod
+    def _on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        """Configure a new pooled connection once instead of on every session."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        # Let readers of concurrent commands proceed while another one writes,
+        # and only sync the write-ahead log at checkpoints instead of every commit.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        # wait for a competing writer instead of failing with "database is locked"
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
 
     @staticmethod
     def path() -> str:
@@ -59,12 +72,11 @@ class DB:
     @contextmanager
     @staticmethod
     def session() -> Generator[Session, None, None]:
-        SessionLocal = sessionmaker(bind=DB.engine())
-        session = SessionLocal()
+        # the pragmas are set once per pooled connection, see _on_connect
+        session = Session(bind=DB.engine())
 
         try:
-            session.execute(sqlalchemy.text("PRAGMA foreign_keys=ON"))
-            yield session  # type: ignore
+            yield session
         finally:
             session.close()
 
@@ -14,6 +14,7 @@ class Regex:
     USER_GROUP_ID_PATTERN: Final[re.Pattern[str]] = re.compile(
         r"data-user-group-id=\"(?P<id>\d+)\""
     )
+    PARAGRAPH_PATTERN: Final[re.Pattern[str]] = re.compile(r"<p>(.*?)</p>", re.DOTALL)
 
     # todo: (jr) docuemnt why two different regex libraries are used
     ARGUMENT_PATTERN = regex.compile(
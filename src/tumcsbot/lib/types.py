@@ -298,6 +298,8 @@ class ZulipChannel(
     Inferface for Zulip channels that dynamically fetches the user ID and name and can be used as a type in the database.
     """
 
+    cache_ok = True
+
     def __init__(self,
         identifier: str | int | None = None,
         name: str | None = None,
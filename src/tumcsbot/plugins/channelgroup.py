@@ -3,13 +3,15 @@
 # See LICENSE file for copyright and license details.
 # TUM CS Bot - https://github.com/ro-i/tumcsbot
 
+import asyncio
+from functools import lru_cache
 from inspect import cleandoc
 import logging
 from typing import Any, Iterable, AsyncGenerator, cast
 
 from sqlalchemy import Column, String, Integer, ForeignKey, Boolean
 import sqlalchemy
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy.orm import relationship, Mapped, ORMExecuteState
 from sqlalchemy.ext.hybrid import hybrid_property
 
 from tumcsbot.lib.regex import Regex
@@ -111,6 +113,53 @@ class GroupClaimAll(TableBase):  # type: ignore
     # UniqueConstraint('MessageId', name='uq_group_claims_all_message_id')
 
 
+# Deleting a UserGroup cascades to its ChannelGroup in the database, so writes
+# to either table invalidate the emoji cache below.
+_EMOJI_CACHE_TABLES: tuple[type, ...] = (ChannelGroup, UserGroup)
+
+
+@lru_cache(maxsize=256)
+def _group_id_by_emoji(emoji: str) -> str | None:
+    """Look up the ChannelGroup id of an emoji, cached across sessions."""
+    with DB.session() as session:
+        group_id: str | None = (
+            session.query(ChannelGroup.ChannelGroupId)
+            .filter(ChannelGroup.ChannelGroupEmote == emoji)
+            .scalar()
+        )
+    return group_id
+
+
+@sqlalchemy.event.listens_for(Session, "after_flush")
+def _mark_channelgroups_flushed(session: Session, _flush_context: Any) -> None:
+    if any(
+        isinstance(obj, _EMOJI_CACHE_TABLES)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info["channelgroups_changed"] = True
+
+
+@sqlalchemy.event.listens_for(Session, "do_orm_execute")
+def _mark_channelgroups_executed(state: ORMExecuteState) -> None:
+    if (
+        (state.is_insert or state.is_update or state.is_delete)
+        and state.bind_mapper is not None
+        and issubclass(state.bind_mapper.class_, _EMOJI_CACHE_TABLES)
+    ):
+        state.session.info["channelgroups_changed"] = True
+
+
+@sqlalchemy.event.listens_for(Session, "after_commit")
+def _invalidate_emoji_cache(session: Session) -> None:
+    if session.info.pop("channelgroups_changed", False):
+        _group_id_by_emoji.cache_clear()
+
+
+@sqlalchemy.event.listens_for(Session, "after_rollback")
+def _forget_channelgroup_changes(session: Session) -> None:
+    session.info.pop("channelgroups_changed", None)
+
+
 class Channelgroup(PluginCommand, Plugin):
     """
     Manage ChannelGroups.
@@ -1050,15 +1099,15 @@ class Channelgroup(PluginCommand, Plugin):
         Returns:
             None
         """
-        if (
-            session.query(ChannelGroup)
+        if session.query(
+            session.query(ChannelGroup.ChannelGroupId)
             .filter(ChannelGroup.ChannelGroupId == ID)
-            .first()
-            is not None
-        ):
+            .exists()
+        ).scalar():
             raise DMError(f"Channelgroup `{ID}` already exists")
 
-        ugroup: UserGroup = Channelgroup.create_usergroup(session, ID)
+        # flushed only, the GroupId is known without reloading the committed group
+        ugroup: UserGroup = Channelgroup.create_usergroup(session, ID, commit=False)
         group = ChannelGroup(
             ChannelGroupId=ID, ChannelGroupEmote=emote, UserGroupId=ugroup.GroupId
         )
@@ -1089,15 +1138,15 @@ class Channelgroup(PluginCommand, Plugin):
         Returns:
             Channelgroup
         """
-        if (
-            session.query(ChannelGroup)
+        if session.query(
+            session.query(ChannelGroup.ChannelGroupId)
             .filter(ChannelGroup.ChannelGroupId == ID)
-            .first()
-            is not None
-        ):
+            .exists()
+        ).scalar():
             raise DMError(f"Channelgroup `{ID}` already exists")
 
-        ugroup: UserGroup = Channelgroup.create_usergroup(session, ID)
+        # flushed only, the GroupId is known without reloading the committed group
+        ugroup: UserGroup = Channelgroup.create_usergroup(session, ID, commit=False)
         group = ChannelGroup(
             ChannelGroupId=ID, ChannelGroupEmote=emote, UserGroupId=ugroup.GroupId
         )
@@ -1112,13 +1161,14 @@ class Channelgroup(PluginCommand, Plugin):
         return group
 
     @staticmethod
-    def create_usergroup(session: Session, ID: str) -> UserGroup:
+    def create_usergroup(session: Session, ID: str, commit: bool = True) -> UserGroup:
         """
         Create a new UserGroup for the subscribers of a ChannelGroup.
 
         Args:
             session: The database session.
             ID: The id of the group.
+            commit: Commit the new group, otherwise only flush it so that the caller can commit it together with the ChannelGroup.
 
         Raises:
             DMError: If the group creation fails.
@@ -1131,7 +1181,10 @@ class Channelgroup(PluginCommand, Plugin):
 
         try:
             session.add(group)
-            session.commit()
+            if commit:
+                session.commit()
+            else:
+                session.flush()
         except sqlalchemy.exc.IntegrityError as e:
             session.rollback()
             raise DMError(f"Could not create usergroup '{name}'.") from e
@@ -1190,25 +1243,9 @@ class Channelgroup(PluginCommand, Plugin):
         Returns:
             None
         """
-        for channel in channels:
-            if (
-                session.query(ChannelGroupMember)
-                .filter(ChannelGroupMember.Channel == channel.id)
-                .filter(ChannelGroupMember.ChannelGroupId == group.ChannelGroupId)
-                .first()
-                is None
-            ):
-                continue
-            try:
-                # search for the listed channels in the db and delete them
-                session.query(ChannelGroupMember).filter(
-                    ChannelGroupMember.Channel == channel.id
-                ).filter(
-                    ChannelGroupMember.ChannelGroupId == group.ChannelGroupId
-                ).delete()
-                session.commit()
-            except sqlalchemy.exc.IntegrityError:
-                session.rollback()
+        await Channelgroup.remove_channels_by_id(
+            session, group, [channel.id for channel in channels]
+        )
 
     @staticmethod
     async def remove_channels_by_id(
@@ -1216,55 +1253,48 @@ class Channelgroup(PluginCommand, Plugin):
         group: ChannelGroup,
         channel_ids: list[int],
     ) -> None:
-        for Id in channel_ids:
-            if (
-                session.query(ChannelGroupMember)
-                .filter(ChannelGroupMember.Channel == Id)
-                .filter(ChannelGroupMember.ChannelGroupId == group.ChannelGroupId)
-                .first()
-                is None
-            ):
-                continue
-            try:
-                # search for the listed channels in the db and delete them
-                session.query(ChannelGroupMember).filter(
-                    ChannelGroupMember.Channel == Id
-                ).filter(
-                    ChannelGroupMember.ChannelGroupId == group.ChannelGroupId
-                ).delete()
-                session.commit()
-            except sqlalchemy.exc.IntegrityError:
-                session.rollback()
+        if not channel_ids:
+            return
+        try:
+            # one DELETE for all channels, channels that are not in the group are no-ops
+            session.query(ChannelGroupMember).filter(
+                ChannelGroupMember.ChannelGroupId == group.ChannelGroupId,
+                ChannelGroupMember.Channel.in_(channel_ids),
+            ).delete(synchronize_session=False)
+            session.commit()
+        except sqlalchemy.exc.IntegrityError:
+            session.rollback()
 
     @staticmethod
     def add_zulip_channels(
         session: Session, channels: list[ZulipChannel], group: ChannelGroup
     ) -> None:
-        failed: list[str] = []
+        # one query for the existing members and one commit for all new ones
+        members: list[tuple[ZulipChannel]] = (
+            session.query(ChannelGroupMember.Channel)
+            .filter(ChannelGroupMember.ChannelGroupId == group.ChannelGroupId)
+            .all()
+        )
+        member_ids: set[int] = {member.id for (member,) in members}
+        new_channels: list[ZulipChannel] = []
         for channel in channels:
-            if (
-                session.query(ChannelGroupMember)
-                .filter(ChannelGroupMember.ChannelGroupId == group.ChannelGroupId)
-                .filter(ChannelGroupMember.Channel == channel)  # type: ignore
-                .first()
-            ):
+            if channel.id in member_ids:
                 continue
-            try:
-                session.add(
-                    ChannelGroupMember(
-                        ChannelGroupId=group.ChannelGroupId, Channel=channel
-                    )
-                )
-                session.commit()
-            except sqlalchemy.exc.IntegrityError:
-                session.rollback()
-                failed.append(f"#**{channel.name}**")
+            member_ids.add(channel.id)
+            new_channels.append(channel)
 
-        if failed:
-            s: str = " ".join(failed)
+        try:
+            session.add_all(
+                ChannelGroupMember(ChannelGroupId=group.ChannelGroupId, Channel=channel)
+                for channel in new_channels
+            )
+            session.commit()
+        except sqlalchemy.exc.IntegrityError as e:
+            session.rollback()
+            s: str = " ".join(f"#**{channel.name}**" for channel in new_channels)
             raise DMError(
                 f"Could not add channel(s) {s} to Channelgroup `{group.ChannelGroupId}`."
-            )
+            ) from e
 
     @staticmethod
     async def subscribe_h(client: AsyncClient, user_id: int, group_id: str) -> None:
@@ -1444,26 +1474,24 @@ class Channelgroup(PluginCommand, Plugin):
             if group is None:
                 raise DMError("No group specified.")
 
-            if (
-                session.query(GroupClaim)
-                .filter(GroupClaim.GroupId == group.ChannelGroupId)
-                .filter(GroupClaim.MessageId == message_id)
-                .first()
-                is None
-            ):
-                raise DMError(
-                    f"Message {message_id} is not in claimed in Channelgroup '{group.ChannelGroupId}'"
-                )
             try:
-                session.query(GroupClaim).filter(
-                    GroupClaim.GroupId == group.ChannelGroupId
-                ).filter(GroupClaim.MessageId == message_id).delete()
+                # the number of deleted rows tells whether the message was claimed
+                deleted: int = (
+                    session.query(GroupClaim)
+                    .filter(GroupClaim.GroupId == group.ChannelGroupId)
+                    .filter(GroupClaim.MessageId == message_id)
+                    .delete()
+                )
                 session.commit()
             except sqlalchemy.exc.IntegrityError as e:
                 session.rollback()
                 raise DMError(
                     f"Could not unclaim message '{message_id}' in Channelgroup `{group.ChannelGroupId}`."
                 ) from e
+            if deleted == 0:
+                raise DMError(
+                    f"Message {message_id} is not in claimed in Channelgroup '{group.ChannelGroupId}'"
+                )
         else:
             # delete msg from claim_all_db
             try:
@@ -1623,26 +1651,29 @@ class Channelgroup(PluginCommand, Plugin):
             None
         """
 
-        if (
-            session.query(GroupClaimAll)
-            .filter(GroupClaimAll.MessageId == message_id)
-            .first()
-            is None
-        ):
-            raise DMError(f"Message '{message_id}' is not yet claimed.")
         try:
-            session.query(GroupClaimAll).filter(
-                GroupClaimAll.MessageId == message_id
-            ).delete()
+            # the number of deleted rows tells whether the message was claimed
+            deleted: int = (
+                session.query(GroupClaimAll)
+                .filter(GroupClaimAll.MessageId == message_id)
+                .delete()
+            )
             session.commit()
         except sqlalchemy.exc.IntegrityError as e:
             session.rollback()
             raise DMError(f"Could not unclaim message '{message_id}'.") from e
+        if deleted == 0:
+            raise DMError(f"Message '{message_id}' is not yet claimed.")
 
         await client.delete_message(message_id)
 
     @staticmethod
-    async def fix_h(client: AsyncClient, session: Session, group: ChannelGroup) -> None:
+    async def fix_h(
+        client: AsyncClient,
+        session: Session,
+        group: ChannelGroup,
+        server_channels: list[dict[str, Any]] | None = None,
+    ) -> None:
         """
         Makes sure that every subscriber of the given group is subscribed to all channels of this group.
 
@@ -1650,6 +1681,7 @@ class Channelgroup(PluginCommand, Plugin):
             sender: ZulipUser sending the message
             session: The database session.
             group: The ChannelGroup to fix.
+            server_channels: The channel list of the server, fetched if omitted.
 
         Raises:
             DMError: If a fixing fails.
@@ -1660,7 +1692,7 @@ class Channelgroup(PluginCommand, Plugin):
         ugroup: UserGroup = Channelgroup.get_usergroup(session, group)
         user_ids: list[int] = Usergroup.get_user_ids_for_group(session, ugroup)
         channel_names: list[str] = await Channelgroup.get_channel_names(
-            session, client, [group]
+            session, client, [group], server_channels
         )
 
         channels: list[tuple[str, str | None]] = [
@@ -1686,8 +1718,14 @@ class Channelgroup(PluginCommand, Plugin):
         """
         groups: list[ChannelGroup] = session.query(ChannelGroup).all()
 
+        # fetch the server's channels once for all groups
+        server_channels_response = await client.get_channels()
+        if server_channels_response["result"] != "success":
+            raise DMError("Could not get channels from server.")
+        server_channels: list[dict[str, Any]] = server_channels_response["streams"]
+
         for group in groups:
-            await Channelgroup.fix_h(client, session, group)
+            await Channelgroup.fix_h(client, session, group, server_channels)
 
     # ========================================================================================================================
     #       HELPER METHODS
@@ -1699,16 +1737,7 @@ class Channelgroup(PluginCommand, Plugin):
         Get the identifier of a Channelgroup by an emoji name.
         Returns None if given emoji is not associated with any ChannelGroup.
         """
-        result: str | None = None
-        with DB.session() as session:
-            sg: ChannelGroup | None = (
-                session.query(ChannelGroup)
-                .filter(ChannelGroup.ChannelGroupEmote == emoji)
-                .one_or_none()
-            )
-            if sg:
-                result = str(sg.ChannelGroupId)
-        return result
+        return _group_id_by_emoji(emoji)
 
     @staticmethod
     def get_group_ids_from_channel_id(Id: int) -> list[str]:
@@ -1746,51 +1775,54 @@ class Channelgroup(PluginCommand, Plugin):
         Decides whether the message of a given message-id is in any form claimed
         (either by all Channelgroups or by the Channelgroup associated with a given emote).
         """
-        claimedByOne: bool
-        claimedByAll: bool
         group_id: str | None = Channelgroup.get_group_id_from_emoji_event(em)
 
         if group_id is None:
             return False
 
+        # a single SELECT EXISTS(...) OR EXISTS(...) instead of loading claim rows
         with DB.session() as session:
-            claimedByOne = (
-                session.query(GroupClaim)
-                .filter(GroupClaim.MessageId == msg_id)
-                .filter(GroupClaim.GroupId == group_id)
-                .first()
-                is not None
-            )
-            claimedByAll = (
-                session.query(GroupClaimAll)
-                .filter(GroupClaimAll.MessageId == msg_id)
-                .first()
-                is not None
-            )
-        return claimedByOne or claimedByAll
+            claimed = session.query(
+                sqlalchemy.exists().where(
+                    GroupClaim.MessageId == msg_id, GroupClaim.GroupId == group_id
+                )
+                | sqlalchemy.exists().where(GroupClaimAll.MessageId == msg_id)
+            ).scalar()
+        return bool(claimed)
 
     @staticmethod
     async def get_channel_names(
-        session: Session, client: AsyncClient, groups: list[ChannelGroup]
+        session: Session,
+        client: AsyncClient,
+        groups: list[ChannelGroup],
+        server_channels: list[dict[str, Any]] | None = None,
     ) -> list[str]:
         """
         Get a list of the names of all channels that are members at least one of the Channelgroups in a list of ChannelGroups.
+
+        Callers handling several groups can pass the server's channel list
+        as `server_channels` to avoid fetching it once per call.
         """
-        channels_ids: set[int] = set()
-        server_channels_response = await client.get_channels()
+        if server_channels is None:
+            server_channels_response = await client.get_channels()
 
-        if server_channels_response["result"] != "success":
-            logging.error("Could not get channels from server.")
-            return []
+            if server_channels_response["result"] != "success":
+                logging.error("Could not get channels from server.")
+                return []
 
-        server_channels = server_channels_response["streams"]
+            server_channels = server_channels_response["streams"]
 
-        for group in groups:
-            channels_ids.update(
-                m.Channel.id
-                for m in session.query(ChannelGroupMember)
-                .filter(ChannelGroupMember.ChannelGroupId == group.ChannelGroupId)
-                .all())
+        # one query for the members of all groups
+        members: list[tuple[ZulipChannel]] = (
+            session.query(ChannelGroupMember.Channel)
+            .filter(
+                ChannelGroupMember.ChannelGroupId.in_(
+                    [group.ChannelGroupId for group in groups]
+                )
+            )
+            .all()
+        )
+        channels_ids: set[int] = {member.id for (member,) in members}
 
         to_keep = [
             x["name"]
@@ -1804,17 +1836,15 @@ class Channelgroup(PluginCommand, Plugin):
         """
         Get a list of all channels that are members of a given Channelgroup.
         """
-        channels: set[ZulipChannel] = set()
-        for s in (
-            session.query(ChannelGroupMember)
+        rows: list[tuple[ZulipChannel]] = (
+            session.query(ChannelGroupMember.Channel)
             .filter(ChannelGroupMember.ChannelGroupId == group.ChannelGroupId)
             .all()
-        ):
-            chan: ZulipChannel = cast(ZulipChannel, s.Channel)
-            await chan
-            channels.add(chan)
-
-        return list(channels)
+        )
+        channels: list[ZulipChannel] = list({chan for (chan,) in rows})
+        # Resolving a channel is a request to Zulip, so resolve all of them at once.
+        await asyncio.gather(*channels)
+        return channels
 
     @staticmethod
     async def get_unique_channel_names(
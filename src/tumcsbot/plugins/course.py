@@ -4,11 +4,10 @@
 # TUM CS Bot - https://github.com/ro-i/tumcsbot
 
 import asyncio
-import difflib
+from functools import partial
 from inspect import cleandoc
-import inspect
 import logging
-from typing import Coroutine, Literal, cast, Any, Callable, AsyncGenerator, TypeVar
+from typing import Awaitable, Coroutine, Literal, cast, Any, Callable, AsyncGenerator, TypeVar
 
 import sqlalchemy
 from sqlalchemy import (
@@ -16,9 +15,16 @@ from sqlalchemy import (
     String,
     Integer,
     ForeignKey,
+    Select,
+    delete,
+    func,
+    literal,
+    select,
+    union_all,
     update,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import InstrumentedAttribute, relationship
 from tumcsbot.lib.regex import Regex
 
 from tumcsbot.lib.response import Response
@@ -41,6 +47,81 @@ from tumcsbot.lib.types import (
 
 T = TypeVar("T")
 
+# Undoes one step of a partially created Course, see Course._run_cleanups.
+# Database steps run right away and return None, Zulip calls return an awaitable.
+CleanupOperation = Callable[[], Awaitable[Any] | None]
+
+# (language, role) -> (name, description) of the internal Channels of a Course
+CHANNEL_TEMPLATES: dict[tuple[str, str], tuple[str, str]] = {
+    ("en", "tutors"): ("{name} - Tutors", "Internal Channel for {name}-Tutors"),
+    ("de", "tutors"): ("{name} - Tutoren", "Interner Kanal für {name}-Tutoren"),
+    ("en", "instructors"): (
+        "{name} - Instructors",
+        "Internal Channel for Instructors of {name}",
+    ),
+    ("de", "instructors"): (
+        "{name} - Übungsleiter",
+        "Interner Kanal für {name}-Übungsleiter",
+    ),
+    ("en", "feedback"): ("{name} - Feedback", "Anonymous Channel for Feedback to {name}"),
+    ("de", "feedback"): ("{name} - Feedback", "Anonymer Kanal für Feedback zu {name}"),
+}
+
+# ((suffix en, suffix de), (description en, description de)) of the standard
+# Channels: announcements, general, organization, feedback, anonymous feedback,
+# tech support and memes, see Course.add_standard_channels
+STANDARD_CHANNEL_TEMPLATES: tuple[tuple[tuple[str, str], tuple[str, str]], ...] = (
+    (
+        ("Announcements", "Ankündigungen"),
+        (
+            "Welcome to the Channel for Announcements for {name}",
+            "Willkommen im Zulip Kanal für Ankündigungen von {name}",
+        ),
+    ),
+    (
+        ("General", "Allgemein"),
+        (
+            "Welcome to the general Channel of {name}",
+            "Willkommen im allgemeinen Zulip Kanal von dem Kurs {name}",
+        ),
+    ),
+    (
+        ("Organization", "Organisation"),
+        (
+            "Welcome to the organizational Channel of {name}",
+            "Willkommen im Orga-Zulip Kanal von dem Kurs {name}",
+        ),
+    ),
+    (
+        ("Feedback", "Feedback"),
+        (
+            "Welcome to the Channel for Feedback to {name}",
+            "Willkommen im Feedback Zulip Kanal von dem Kurs {name}",
+        ),
+    ),
+    (
+        ("Feedback", "Feedback"),
+        (
+            "Welcome to the Channel for Feedback to {name}, where you can send anonymous Feedback with the help of the TUM CS Bot.",
+            "Willkommen im Feedback Zulip Kanal von dem Kurs {name}, in welchem du mit der Hilfe des TUM CS Bot anonymes Feedback senden kannst.",
+        ),
+    ),
+    (
+        ("TechSupport", "Technik"),
+        (
+            "Welcome to the Channel for Tech-Support in {name}",
+            "Willkommen im Technik Zulip Kanal von {name}",
+        ),
+    ),
+    (
+        ("Memes", "Memes"),
+        (
+            "Welcome to the Channel for top-quality Memes of {name}",
+            "Willkommen im Memes Zulip Kanal von {name}",
+        ),
+    ),
+)
+
 
 class CourseDB(TableBase):  # type: ignore
     """Represents a course in the system."""
@@ -68,18 +149,26 @@ class CourseDB(TableBase):  # type: ignore
     InstructorChannel = Column(ZulipChannel, nullable=True)  # type: ignore
     FeedbackChannel = Column(ZulipChannel, nullable=True)  # type: ignore # not Null if anonymous feedback enabled
 
+    # list, overview, create_channel, update and mute/unmute all need the
+    # Channelgroup of a Course, so load it together with the Course.
     _channels = relationship(
         "ChannelGroup",
         back_populates="_course",
         cascade="all, delete-orphan",
         single_parent=True,
+        lazy="selectin",
     )
+
+    # The Usergroups are only needed by the few commands handling tutors and
+    # instructors. Fail loudly on accidental lazy loads; these commands fetch
+    # the group explicitly (or use selectinload()).
     _tutors = relationship(
         "UserGroup",
         back_populates="_courseT",
         cascade="all, delete-orphan",
         single_parent=True,
         foreign_keys="CourseDB.TutorsUserGroup",
+        lazy="raise",
     )
 
     _instructors = relationship(
@@ -88,14 +177,21 @@ class CourseDB(TableBase):  # type: ignore
         cascade="all, delete-orphan",
         single_parent=True,
         foreign_keys="CourseDB.InstructorsUserGroup",
+        lazy="raise",
     )
 
+    @hybrid_property
+    def channelgroup(self) -> ChannelGroup | None:
+        return cast(ChannelGroup | None, self._channels)
+
 
 class Course(PluginCommand, Plugin):
     """
     Manage Courses.
     """
 
+    _LIST_PAGE_SIZE: int = 50
+
     # ========================================================================================================================
     #       SUBCOMMANDS
     # ========================================================================================================================
@@ -113,27 +209,40 @@ class Course(PluginCommand, Plugin):
         """
         List all Courses with their associated Channels.
         """
-        response: str = "Course Name | Emoji | Channels \n---- | ---- | ----"
-
-        courses: list[CourseDB] = session.query(CourseDB).all()
-
-        if len(courses) == 0:
-            raise DMError("No courses found")
-
-        for course in courses:
-            course_name = course.CourseName
-            emoji: str = Course.get_emoji(course, session)
-            num_channels = len(
-                list(
-                    session.query(ChannelGroupMember)
-                    .filter(ChannelGroupMember.ChannelGroupId == course.Channels)
-                    .all()
-                )
+        header: str = "Course Name | Emoji | Channels \n---- | ---- | ----"
+        lines: list[str] = []
+        found: bool = False
+
+        course_name: str
+        emoji: str
+        num_channels: int
+        # one query for all courses instead of one per course,
+        # sent in pages to stay below Zulip's message size limit
+        for course_name, emoji, num_channels in (
+            session.query(
+                CourseDB.CourseName,
+                ChannelGroup.ChannelGroupEmote,
+                func.count(ChannelGroupMember.Channel),
             )
+            .join(ChannelGroup, ChannelGroup.ChannelGroupId == CourseDB.Channels)
+            .outerjoin(
+                ChannelGroupMember,
+                ChannelGroupMember.ChannelGroupId == ChannelGroup.ChannelGroupId,
+            )
+            .group_by(CourseDB.CourseId)
+            .order_by(CourseDB.CourseName)
+        ):
+            found = True
+            lines.append(f"{course_name} | {emoji} :{emoji}: | {num_channels} Channels")
+            if len(lines) >= Course._LIST_PAGE_SIZE:
+                yield DMResponse("\n".join([header, *lines]))
+                lines = []
 
-            response += f"\n{course_name} | {emoji} :{emoji}: | {num_channels} Channels"
+        if not found:
+            raise DMError("No courses found")
 
-        yield DMResponse(response)
+        if lines:
+            yield DMResponse("\n".join([header, *lines]))
 
     @command
     @privilege(Privilege.ADMIN)
@@ -191,74 +300,48 @@ class Course(PluginCommand, Plugin):
         channelgroup_emoji: str = args.emoji
         channels: ChannelGroup | None = None
 
-        cleanup_opterations: list[
-            Callable[[], None]
-            | Callable[[], Coroutine[Any, Any, dict[str, Any]]]
-            | Callable[[], Coroutine[Any, Any, None]]
-        ] = []
+        cleanup_opterations: list[CleanupOperation] = []
 
-        if (
-            session.query(CourseDB).filter(CourseDB.CourseName == name).first()
-            is not None
-        ):
-            result1 = await self.client.send_response(
-                Response.build_message(
-                    message,
-                    content=f"Course `{name}` already exists. Dou you want to replace it with an empty Course?",
-                )
-            )
-            if result1["result"] != "success":
-                raise DMError("Could not send message to user")
+        usergroup_name_tut: str = "tutors_" + name
+        usergroup_name_ins: str = "instructors_" + name
+
+        existing: dict[str, Any] = Course._find_existing(
+            session,
+            name=name,
+            emoji=channelgroup_emoji,
+            usergroups={"tutors": usergroup_name_tut, "instructors": usergroup_name_ins},
+        )
 
-            resp1, _ = await UserInput.confirm(self.client, result1["id"], timeout=60)
+        if "course" in existing:
+            resp1 = await self._confirm(
+                message,
+                f"Course `{name}` already exists. Dou you want to replace it with an empty Course?",
+            )
             if not resp1:
                 yield DMResponse(
                     "Ok, I will not create a new Course. Please choose another name."
                 )
                 return
 
-        if (
-            session.query(ChannelGroup)
-            .filter(ChannelGroup.ChannelGroupEmote == channelgroup_emoji)
-            .first()
-            is not None
-        ):
-            result2 = await self.client.send_response(
-                Response.build_message(
-                    message,
-                    content=f"A Channelgroup with :{channelgroup_emoji}: already exists. Dou you want to replace it with an empty Channelgroup for your Course?",
-                )
+        if "channelgroup" in existing:
+            resp2 = await self._confirm(
+                message,
+                f"A Channelgroup with :{channelgroup_emoji}: already exists. Dou you want to replace it with an empty Channelgroup for your Course?",
             )
-            if result2["result"] != "success":
-                raise DMError("Could not send message to user")
-
-            resp2, _ = await UserInput.confirm(self.client, result2["id"], timeout=60)
             if not resp2:
-                res = await self.client.send_response(
-                    Response.build_message(
-                        message,
-                        content=f"Do you want to use the existing Channelgroup with :{channelgroup_emoji}: for your Course?",
-                    )
+                rep = await self._confirm(
+                    message,
+                    f"Do you want to use the existing Channelgroup with :{channelgroup_emoji}: for your Course?",
                 )
-                if res["result"] != "success":
-                    raise DMError("Could not send message to user")
-
-                rep, _ = await UserInput.confirm(self.client, res["id"], timeout=60)
                 if not rep:
                     yield DMResponse(
                         f"Ok, I will not create a new Course then. Please choose another emote because :{channelgroup_emoji}: is already in use :botsad:"
                     )
                     return
-                channels = (
-                    session.query(ChannelGroup)
-                    .filter(ChannelGroup.ChannelGroupEmote == channelgroup_emoji)
-                    .first()
-                )
+                channels = session.get(ChannelGroup, existing["channelgroup"])
             else:
-                sg: ChannelGroup | None = (
-                    session.query(ChannelGroup)
-                    .filter(ChannelGroup.ChannelGroupEmote == channelgroup_emoji)
-                    .first()
+                sg: ChannelGroup | None = session.get(
+                    ChannelGroup, existing["channelgroup"]
                 )
                 if sg is not None:
                     await Channelgroup.delete_group_h(session, sg, self.client)
@@ -276,11 +359,7 @@ class Course(PluginCommand, Plugin):
             # get a corresponding (empty) Channelgroup
             if not channels:
 
-                c_g_same_name: ChannelGroup | None = (
-                    session.query(ChannelGroup)
-                    .filter(ChannelGroup.ChannelGroupId == name)
-                    .first()
-                )
+                c_g_same_name: ChannelGroup | None = session.get(ChannelGroup, name)
                 if c_g_same_name is not None:
                     await Channelgroup.delete_group_h(
                         session, c_g_same_name, self.client
@@ -290,233 +369,121 @@ class Course(PluginCommand, Plugin):
                     session, name, channelgroup_emoji, self.client
                 )
                 cleanup_opterations.append(
-                    lambda: Channelgroup.delete_group_h(session, channels, self.client)
-                )
-
-            # get a corresponding (empty) Usergroup
-            usergroup_name_tut: str = "tutors_" + name
-
-            if (
-                session.query(UserGroup)
-                .filter(UserGroup.GroupName == usergroup_name_tut)
-                .first()
-                is not None
-            ):
-                result3 = await self.client.send_response(
-                    Response.build_message(
-                        message,
-                        content="Usergroup for Tutors of this Course already exists. Dou you want to replace it with a new empty Usergroup for your Course?",
-                    )
+                    partial(Channelgroup.delete_group_h, session, channels, self.client)
                 )
-                if result3["result"] != "success":
-                    raise DMError("Could not send message to user")
 
-                resp3, _ = await UserInput.confirm(
-                    self.client, result3["id"], timeout=60
-                )
-                if not resp3:
-                    raise DMError(
-                        f"Ok, I will not create a new empty Course then. You can use the command `course create -t {usergroup_name_tut}` to use the existing Usergroup for Tutors."
-                    )
-
-                ugt: UserGroup | None = (
-                    session.query(UserGroup)
-                    .filter(UserGroup.GroupName == usergroup_name_tut)
-                    .first()
-                )
-                if ugt is not None:
-                    Usergroup.delete_group(session, ugt)
-
-            tutors = Usergroup.create_and_get_group(session, usergroup_name_tut)
-            cleanup_opterations.append(lambda: Usergroup.delete_group(session, tutors))
+            tutors_channel_name, tutors_channel_desc = Course._channel_texts(
+                lan, "tutors", name
+            )
+            instructor_channel_name, instructor_channel_desc = Course._channel_texts(
+                lan, "instructors", name
+            )
+            feedback_channel_name, feedback_channel_desc = Course._channel_texts(
+                lan, "feedback", name
+            )
 
-            # get a corresponding (empty) Usergroup
-            usergroup_name_ins: str = "instructors_" + name
+            tut_ex, ins_ex, f_ex = await Course._probe_channels(
+                self.client,
+                tutors_channel_name,
+                instructor_channel_name if opts.i else None,
+                feedback_channel_name if opts.f else None,
+            )
 
-            if (
-                session.query(UserGroup)
-                .filter(UserGroup.GroupName == usergroup_name_ins)
-                .first()
-                is not None
-            ):
-                result4 = await self.client.send_response(
-                    Response.build_message(
-                        message,
-                        content="Usergroup for Instructors of this Course already exists. Dou you want to replace it with a new empty Usergroup for your Course?",
+            # (question, answer on decline) for every Usergroup and Channel that would be replaced
+            replacements: list[tuple[str, str]] = []
+            if "tutors" in existing:
+                replacements.append(
+                    (
+                        "Usergroup for Tutors of this Course already exists. Dou you want to replace it with a new empty Usergroup for your Course?",
+                        f"Ok, I will not create a new empty Course then. You can use the command `course create -t {usergroup_name_tut}` to use the existing Usergroup for Tutors.",
                     )
                 )
-                if result4["result"] != "success":
-                    raise DMError("Could not send message to user")
-
-                resp4, _ = await UserInput.confirm(
-                    self.client, result4["id"], timeout=60
-                )
-                if not resp4:
-                    raise DMError(
-                        f"Ok, I will not create a new empty Course then. You can use the command `course create -i {usergroup_name_ins}` to use the existing Usergroup for Instructors."
+            if "instructors" in existing:
+                replacements.append(
+                    (
+                        "Usergroup for Instructors of this Course already exists. Dou you want to replace it with a new empty Usergroup for your Course?",
+                        f"Ok, I will not create a new empty Course then. You can use the command `course create -i {usergroup_name_ins}` to use the existing Usergroup for Instructors.",
                     )
-
-                ugi: UserGroup | None = (
-                    session.query(UserGroup)
-                    .filter(UserGroup.GroupName == usergroup_name_ins)
-                    .first()
                 )
-                if ugi is not None:
-                    Usergroup.delete_group(session, ugi)
-
-            instructors = Usergroup.create_and_get_group(session, usergroup_name_ins)
-            cleanup_opterations.append(
-                lambda: Usergroup.delete_group(session, instructors)
-            )
-
-            # get a corresponding (empty) Channel for Tutors
-            tutors_channel_name: str = name + " - Tutors"
-            tutors_channel_desc: list[str] = [f"Internal Channel for {name}-Tutors"]
-            if lan == "de":
-                tutors_channel_name = name + " - Tutoren"
-                tutors_channel_desc = [f"Interner Kanal für {name}-Tutoren"]
-
-            tut_ex = await self.client.get_channel_id_by_name(tutors_channel_name)
-
             if tut_ex is not None:
-                result5 = await self.client.send_response(
-                    Response.build_message(
-                        message,
-                        content="Channel for Tutors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?",
+                replacements.append(
+                    (
+                        "Channel for Tutors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?",
+                        f'Ok, I will not create a new empty Course then. You can use the command `course create -tuts "{tutors_channel_name}"` to use the existing Channel for Tutors.',
                     )
                 )
-                if result5["result"] != "success":
-                    raise DMError("Could not send message to user")
-
-                resp5, _ = await UserInput.confirm(
-                    self.client, result5["id"], timeout=60
-                )
-                if not resp5:
-                    raise DMError(
-                        f'Ok, I will not create a new empty Course then. You can use the command `course create -tuts "{tutors_channel_name}"` to use the existing Channel for Tutors.'
+            if ins_ex is not None:
+                replacements.append(
+                    (
+                        "Channel for Instructors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?",
+                        f'Ok, I will not create a new empty Course then. You can use the command `course create -ins "{instructor_channel_name}"` to use the existing Channel for Instructors.',
                     )
+                )
 
-                await self.client.delete_channel(tut_ex)
-
-            result_tut_s: dict[str, Any] = await self.client.add_subscriptions(
-                channels=[
-                    {
-                        "name": tutors_channel_name,
-                        "description": " ".join(tutors_channel_desc),
-                    }
-                ],
-                principals=[sender.id, self.client.id],
-                invite_only=True,
-                history_public_to_subscribers=True,
+            # the questions are independent, so ask them all at once
+            declined: int | None = await self._confirm_all(
+                message, [question for question, _ in replacements]
             )
+            if declined is not None:
+                raise DMError(replacements[declined][1])
 
-            if result_tut_s["result"] != "success":
-                raise DMError(result_tut_s["msg"])
+            # get corresponding (empty) Usergroups
+            for kind in ("tutors", "instructors"):
+                if kind in existing:
+                    replaced: UserGroup | None = session.get(UserGroup, existing[kind])
+                    if replaced is not None:
+                        Usergroup.delete_group(session, replaced)
 
-            tutors_channel: ZulipChannel = ZulipChannel(f"#**{tutors_channel_name}**")
-            await tutors_channel
+            tutors = Usergroup.create_and_get_group(session, usergroup_name_tut)
+            cleanup_opterations.append(partial(Usergroup.delete_group, session, tutors))
 
+            instructors = Usergroup.create_and_get_group(session, usergroup_name_ins)
             cleanup_opterations.append(
-                lambda: self.client.delete_channel(tutors_channel.id)
+                partial(Usergroup.delete_group, session, instructors)
             )
 
-            # get a corresponding (empty) Channel for Instructors or None
-            instructor_channel: ZulipChannel | None = None
-            if opts.i:
-
-                instructor_channel_name: str = name + " - Instructors"
-                instructor_channel_desc: list[str] = [
-                    f"Internal Channel for Instructors of {name}"
-                ]
-                if lan == "de":
-                    instructor_channel_name = name + " - Instructors"
-                    instructor_channel_desc = [f"Interner Kanal für {name}-Instructors"]
-
-                ins_ex = await self.client.get_channel_id_by_name(
-                    instructor_channel_name
-                )
-
-                if ins_ex is not None:
-                    result6 = await self.client.send_response(
-                        Response.build_message(
-                            message,
-                            content="Channel for Instructors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?",
-                        )
-                    )
-                    if result6["result"] != "success":
-                        raise DMError("Could not send message to user")
-
-                    resp6, _ = await UserInput.confirm(
-                        self.client, result6["id"], timeout=60
-                    )
-                    if not resp6:
-                        raise DMError(
-                            f'Ok, I will not create a new empty Course then. You can use the command `course create -ins "{instructor_channel_name}"` to use the existing Channel for Instructors.'
-                        )
-
-                    await self.client.delete_channel(ins_ex)
-
-                result_ins_s: dict[str, Any] = await self.client.add_subscriptions(
-                    channels=[
-                        {
-                            "name": instructor_channel_name,
-                            "description": " ".join(instructor_channel_desc),
-                        }
-                    ],
-                    principals=[sender.id, self.client.id],
-                    invite_only=True,
-                    history_public_to_subscribers=True,
-                )
-
-                if result_ins_s["result"] != "success":
-                    raise DMError(result_ins_s["msg"])
-
-                instructor_channel = ZulipChannel(f"#**{instructor_channel_name}**")
-                await instructor_channel
-
-                cleanup_opterations.append(
-                    lambda: self.client.delete_channel(instructor_channel.id)
+            # replace the existing Channels only after all of them were confirmed
+            await asyncio.gather(
+                *(
+                    self.client.delete_channel(ex)
+                    for ex in (tut_ex, ins_ex, f_ex)
+                    if ex is not None
                 )
+            )
 
-            # get a corresponding (empty) Channel for anonymous Feedback or None
-            feedback_channel: ZulipChannel | None = None
+            # All Channels have the same subscribers. The private ones share one
+            # request, the public Feedback-Channel needs its own, run both at once.
+            principals: list[int] = [sender.id, self.client.id]
+            specs: list[tuple[str, str]] = [(tutors_channel_name, tutors_channel_desc)]
+            if opts.i:
+                specs.append((instructor_channel_name, instructor_channel_desc))
+            creations: list[Coroutine[Any, Any, list[ZulipChannel]]] = [
+                self._create_channels(specs, principals, cleanup_opterations)
+            ]
             if opts.f:
-
-                feedback_channel_name: str = name + " - Feedback"
-                feedback_channel_desc: list[str] = [
-                    f"Anonymous Channel for Feedback to {name}"
-                ]
-                if lan == "de":
-                    feedback_channel_desc = [f"Anonymer Kanal für Feedback zu {name}"]
-
-                f_ex = await self.client.get_channel_id_by_name(feedback_channel_name)
-                if f_ex is None:
-                    raise DMError(
-                        "Uuups, I cannot get the Channel id for the Feedback-Channel"
+                creations.append(
+                    self._create_channels(
+                        [(feedback_channel_name, feedback_channel_desc)],
+                        principals,
+                        cleanup_opterations,
+                        invite_only=False,
                     )
-
-                if ins_ex is not None:
-                    await self.client.delete_channel(f_ex)
-
-                result_fb_s: dict[str, Any] = await self.client.add_subscriptions(
-                    channels=[
-                        {
-                            "name": feedback_channel_name,
-                            "description": " ".join(feedback_channel_desc),
-                        }
-                    ],
-                    principals=[sender.id, self.client.id],
                 )
 
-                if result_fb_s["result"] != "success":
-                    raise DMError(result_fb_s["msg"])
-
-                feedback_channel = ZulipChannel(f"#**{feedback_channel_name}**")
-                await feedback_channel
+            # let both finish, so that the cleanups of the created Channels are registered
+            results = await asyncio.gather(*creations, return_exceptions=True)
+            for res in results:
+                if isinstance(res, BaseException):
+                    raise res
+            private_channels = cast(list[ZulipChannel], results[0])
 
-                cleanup_opterations.append(
-                    lambda: self.client.delete_channel(feedback_channel.id)
-                )
+            tutors_channel: ZulipChannel = private_channels[0]
+            instructor_channel: ZulipChannel | None = (
+                private_channels[1] if opts.i else None
+            )
+            feedback_channel: ZulipChannel | None = (
+                cast(list[ZulipChannel], results[1])[0] if opts.f else None
+            )
 
             # create and add a Course to the DB
             course: CourseDB = CourseDB(
@@ -535,11 +502,7 @@ class Course(PluginCommand, Plugin):
 
         except Exception as e:
             session.rollback()
-            for cleanup in cleanup_opterations:
-                if inspect.iscoroutinefunction(cleanup):
-                    await cleanup()
-                else:
-                    cleanup()
+            await Course._run_cleanups(cleanup_opterations)
             if isinstance(e, DMError):
                 raise e
 
@@ -600,26 +563,23 @@ class Course(PluginCommand, Plugin):
         """
         name: str = args.name
 
-        cleanup_opterations: list[
-            Callable[[], None]
-            | Callable[[], Coroutine[Any, Any, dict[str, Any]]]
-            | Callable[[], Coroutine[Any, Any, None]]
-        ] = []
+        cleanup_opterations: list[CleanupOperation] = []
 
-        if (
-            session.query(CourseDB).filter(CourseDB.CourseName == name).first()
-            is not None
-        ):
-            result1 = await self.client.send_response(
-                Response.build_message(
-                    message,
-                    content=f"Course `{name}` already exists. Dou you want to replace it with the new Course?",
-                )
-            )
-            if result1["result"] != "success":
-                raise DMError("Could not send message to user")
+        usergroups: dict[str, str] = {}
+        if not opts.t:
+            usergroups["tutors"] = "tutors_" + name
+        if not opts.i:
+            usergroups["instructors"] = "instructors_" + name
+
+        existing: dict[str, Any] = Course._find_existing(
+            session, name=name, usergroups=usergroups
+        )
 
-            resp1, _ = await UserInput.confirm(self.client, result1["id"], timeout=60)
+        if "course" in existing:
+            resp1 = await self._confirm(
+                message,
+                f"Course `{name}` already exists. Dou you want to replace it with the new Course?",
+            )
             if not resp1:
                 yield DMResponse(
                     "Ok, I will not create a new Course. Please choose another name."
@@ -668,30 +628,14 @@ class Course(PluginCommand, Plugin):
                 )
 
                 if existing_group is not None:  # emoji already in use
-                    result2 = await self.client.send_response(
-                        Response.build_message(
-                            message,
-                            content=f"A Channelgroup with :{channelgroup_emoji}: already exists. Dou you want to replace it with a new Channelgroup for your Course?",
-                        )
-                    )
-                    if result2["result"] != "success":
-                        raise DMError("Could not send message to user")
-
-                    resp2, _ = await UserInput.confirm(
-                        self.client, result2["id"], timeout=60
+                    resp2 = await self._confirm(
+                        message,
+                        f"A Channelgroup with :{channelgroup_emoji}: already exists. Dou you want to replace it with a new Channelgroup for your Course?",
                     )
                     if not resp2:  # use existing channelgroup or stop
-                        res3 = await self.client.send_response(
-                            Response.build_message(
-                                message,
-                                content=f"Do you want to use the existing Channelgroup with :{channelgroup_emoji}: for your course?",
-                            )
-                        )
-                        if res3["result"] != "success":
-                            raise DMError("Could not send message to user")
-
-                        resp3, _ = await UserInput.confirm(
-                            self.client, res3["id"], timeout=60
+                        resp3 = await self._confirm(
+                            message,
+                            f"Do you want to use the existing Channelgroup with :{channelgroup_emoji}: for your course?",
                         )
                         if not resp3:
                             yield DMResponse(
@@ -707,10 +651,8 @@ class Course(PluginCommand, Plugin):
 
                 if channels is None:
 
-                    c_g_same_name: ChannelGroup | None = (
-                        session.query(ChannelGroup)
-                        .filter(ChannelGroup.ChannelGroupId == name)
-                        .first()
+                    c_g_same_name: ChannelGroup | None = session.get(
+                        ChannelGroup, name
                     )
                     if c_g_same_name is not None:
                         await Channelgroup.delete_group_h(
@@ -724,254 +666,171 @@ class Course(PluginCommand, Plugin):
                     if channels is None:
                         raise DMError("Could not create channelgroup")
                     cleanup_opterations.append(
-                        lambda: Channelgroup.delete_group_h(
-                            session, channels, self.client
-                        )
-                    )
-
-            # get corresponding Usergroup
-            tutors: UserGroup
-            if opts.t:
-                tutors = opts.t
-            else:
-                usergroup_name: str = "tutors_" + name
-
-                if (
-                    session.query(UserGroup)
-                    .filter(UserGroup.GroupName == usergroup_name)
-                    .first()
-                    is not None
-                ):
-                    result4 = await self.client.send_response(
-                        Response.build_message(
-                            message,
-                            content="Usergroup for Tutors of this Course already exists. Dou you want to replace it with a new empty Usergroup for your Course?",
+                        partial(
+                            Channelgroup.delete_group_h, session, channels, self.client
                         )
                     )
-                    if result4["result"] != "success":
-                        raise DMError("Could not send message to user")
-
-                    resp4, _ = await UserInput.confirm(
-                        self.client, result4["id"], timeout=60
-                    )
-                    if not resp4:
-                        raise DMError(
-                            "Ok, I will not create a new Course then. Please choose another name."
-                        )
 
-                    ugt: UserGroup | None = (
-                        session.query(UserGroup)
-                        .filter(UserGroup.GroupName == usergroup_name)
-                        .first()
-                    )
-                    if ugt is not None:
-                        Usergroup.delete_group(session, ugt)
-
-                tutors = Usergroup.create_and_get_group(session, usergroup_name)
-
-                cleanup_opterations.append(
-                    lambda: Usergroup.delete_group(session, tutors)
+            # get corresponding Channels for Tutors, Instructors and anonymous Feedback
+            tutors_channel_name: str | None = None
+            tutors_channel_desc: str = ""
+            if not opts.tuts:
+                tutors_channel_name, tutors_channel_desc = Course._channel_texts(
+                    lan, "tutors", name
                 )
 
-            # get corresponding Usergroup
-            instructors: UserGroup
-            if opts.i:
-                instructors = opts.i
-            else:
-                usergroup_name = "instructors_" + name
-
-                if (
-                    session.query(UserGroup)
-                    .filter(UserGroup.GroupName == usergroup_name)
-                    .first()
-                    is not None
-                ):
-                    result5 = await self.client.send_response(
-                        Response.build_message(
-                            message,
-                            content="Usergroup for Instructors of this Course already exists. Dou you want to replace it with a new empty Usergroup for your Course?",
-                        )
-                    )
-                    if result5["result"] != "success":
-                        raise DMError("Could not send message to user")
-
-                    resp5, _ = await UserInput.confirm(
-                        self.client, result5["id"], timeout=60
-                    )
-                    if not resp5:
-                        raise DMError(
-                            "Ok, I will not create a new Course then. Please choose another name."
-                        )
+            instructor_channel_name: str | None = None
+            instructor_channel_desc: str = ""
+            if not opts.ins:
+                instructor_channel_name, instructor_channel_desc = (
+                    Course._channel_texts(lan, "instructors", name)
+                )
 
-                    ugi = (
-                        session.query(UserGroup)
-                        .filter(UserGroup.GroupName == usergroup_name)
-                        .first()
-                    )
-                    if ugi is not None:
-                        Usergroup.delete_group(session, ugi)
+            feedback_channel_name: str | None = None
+            feedback_channel_desc: str = ""
+            if opts.fb:
+                feedback_channel_name, feedback_channel_desc = Course._channel_texts(
+                    lan, "feedback", name
+                )
 
-                instructors = Usergroup.create_and_get_group(session, usergroup_name)
+            tut_ex, ins_ex, f_ex = await Course._probe_channels(
+                self.client,
+                tutors_channel_name,
+                instructor_channel_name,
+                feedback_channel_name,
+            )
 
-                cleanup_opterations.append(
-                    lambda: Usergroup.delete_group(session, instructors)
+            # ask about every Usergroup and Channel that would be replaced at once,
+            # so that the new Usergroups can be written with a single commit afterwards
+            questions: list[str] = [
+                f"Usergroup for {kind.capitalize()} of this Course already exists. Dou you want to replace it with a new empty Usergroup for your Course?"
+                for kind in usergroups
+                if kind in existing
+            ]
+            if tut_ex is not None:
+                questions.append(
+                    "Channel for Tutors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?"
+                )
+            if ins_ex is not None:
+                questions.append(
+                    "Channel for Instructors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?"
+                )
+            if await self._confirm_all(message, questions) is not None:
+                raise DMError(
+                    "Ok, I will not create a new Course then. Please choose another name."
                 )
 
-            # get corresponding Channel for Tutors
-            tutors_channel: ZulipChannel
-            if opts.tuts:
-                tutors_channel = opts.tuts
-            else:
-                tutors_channel_name: str = name + " - Tutors"
-                tutors_channel_desc: list[str] = [f"Internal Channel for {name}-Tutors"]
-                if lan == "de":
-                    tutors_channel_name = name + " - Tutoren"
-                    tutors_channel_desc = [f"Interner Kanal für {name}-Tutoren"]
-
-                tut_ex = await self.client.get_channel_id_by_name(tutors_channel_name)
+            new_groups: dict[str, UserGroup] = {}
+            for kind, usergroup_name in usergroups.items():
+                if kind in existing:
+                    replaced: UserGroup | None = session.get(UserGroup, existing[kind])
+                    if replaced is not None:
+                        Usergroup.delete_group(session, replaced, commit=False)
+                new_groups[kind] = Usergroup.create_and_get_group(
+                    session, usergroup_name, commit=False
+                )
+            if new_groups:
+                session.commit()
 
-                if tut_ex is not None:
-                    result_tut = await self.client.send_response(
-                        Response.build_message(
-                            message,
-                            content="Channel for Tutors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?",
-                        )
-                    )
-                    if result_tut["result"] != "success":
-                        raise DMError("Could not send message to user")
+            for group in new_groups.values():
+                cleanup_opterations.append(partial(Usergroup.delete_group, session, group))
 
-                    resp_tut_s, _ = await UserInput.confirm(
-                        self.client, result_tut["id"], timeout=60
-                    )
-                    if not resp_tut_s:
-                        raise DMError(
-                            "Ok, I will not create a new Course then. Please choose another name."
-                        )
+            tutors: UserGroup = opts.t if opts.t else new_groups["tutors"]
+            instructors: UserGroup = opts.i if opts.i else new_groups["instructors"]
 
-                    await self.client.delete_channel(tut_ex)
-
-                tutor_ids = Usergroup.get_user_ids_for_group(session, tutors)
-                tutor_ids.append(sender.id)
-                tutor_ids.append(self.client.id)
-
-                result_tut_s = await self.client.add_subscriptions(
-                    channels=[
-                        {
-                            "name": tutors_channel_name,
-                            "description": " ".join(tutors_channel_desc),
-                        }
-                    ],
-                    principals=tutor_ids,
-                    invite_only=True,
-                    history_public_to_subscribers=True,
+            await asyncio.gather(
+                *(
+                    self.client.delete_channel(ex)
+                    for ex in (tut_ex, ins_ex, f_ex)
+                    if ex is not None
                 )
-                if result_tut_s["result"] != "success":
-                    raise DMError(result_tut_s["msg"])
+            )
 
-                tutors_channel = ZulipChannel(f"#**{tutors_channel_name}**")
-                await tutors_channel
+            # (key, name, description, principals, invite_only) of the Channels to create
+            to_create: list[tuple[str, str, str, list[int], bool]] = []
 
-                cleanup_opterations.append(
-                    lambda: self.client.delete_channel(tutors_channel.id)
-                )
+            # the members of both Usergroups with a single query
+            member_ids: dict[int, list[int]] = Usergroup.get_user_ids_for_groups(
+                session,
+                [
+                    group
+                    for group, c_name in (
+                        (tutors, tutors_channel_name),
+                        (instructors, instructor_channel_name),
+                    )
+                    if c_name is not None
+                ],
+            )
 
-            # get a corresponding Channel for Instructors or None
-            instructor_channel: ZulipChannel | None = None
-            if opts.ins:
-                instructor_channel = opts.ins
-            else:
-                instructor_channel_name: str = name + " - Instructors"
-                instructor_channel_desc: list[str] = [
-                    f"Internal Channel for Instructors of {name}"
+            if tutors_channel_name is not None:
+                tutor_ids = member_ids[int(tutors.GroupId)] + [
+                    sender.id,
+                    self.client.id,
                 ]
-                if lan == "de":
-                    instructor_channel_name = name + " - Instructors"
-                    instructor_channel_desc = [f"Interner Kanal für {name}-Instructors"]
-
-                ins_ex = await self.client.get_channel_id_by_name(
-                    instructor_channel_name
+                to_create.append(
+                    ("tutors", tutors_channel_name, tutors_channel_desc, tutor_ids, True)
                 )
 
-                if ins_ex is not None:
-                    result_ins = await self.client.send_response(
-                        Response.build_message(
-                            message,
-                            content="Channel for Instructors of this Course already exists. Dou you want to replace it with a new empty Channel for your Course?",
-                        )
+            if instructor_channel_name is not None:
+                instructor_ids = member_ids[int(instructors.GroupId)] + [
+                    sender.id,
+                    self.client.id,
+                ]
+                to_create.append(
+                    (
+                        "instructors",
+                        instructor_channel_name,
+                        instructor_channel_desc,
+                        instructor_ids,
+                        True,
                     )
-                    if result_ins["result"] != "success":
-                        raise DMError("Could not send message to user")
+                )
 
-                    resp_ins, _ = await UserInput.confirm(
-                        self.client, result_ins["id"], timeout=60
+            if feedback_channel_name is not None:
+                to_create.append(
+                    (
+                        "feedback",
+                        feedback_channel_name,
+                        feedback_channel_desc,
+                        [sender.id, self.client.id],
+                        False,
                     )
-                    if not resp_ins:
-                        raise DMError(
-                            "Ok, I will not create a new Course then. Please choose another name."
-                        )
-
-                    await self.client.delete_channel(ins_ex)
-
-                instructor_ids = Usergroup.get_user_ids_for_group(session, instructors)
-                instructor_ids.append(sender.id)
-                instructor_ids.append(self.client.id)
-
-                result_ins_s: dict[str, Any] = await self.client.add_subscriptions(
-                    channels=[
-                        {
-                            "name": instructor_channel_name,
-                            "description": " ".join(instructor_channel_desc),
-                        }
-                    ],
-                    principals=instructor_ids,
-                    invite_only=True,
-                    history_public_to_subscribers=True,
                 )
-                if result_ins_s["result"] != "success":
-                    raise DMError(result_ins_s["msg"])
 
-                instructor_channel = ZulipChannel(f"#**{instructor_channel_name}**")
-                await instructor_channel
-
-                cleanup_opterations.append(
-                    lambda: self.client.delete_channel(instructor_channel.id)
+            # Channels with the same subscribers and privacy share one request,
+            # the remaining requests do not depend on each other
+            batches: dict[tuple[frozenset[int], bool], list[tuple[str, str, str]]] = {}
+            for key, c_name, c_desc, principals, invite_only in to_create:
+                batches.setdefault((frozenset(principals), invite_only), []).append(
+                    (key, c_name, c_desc)
                 )
 
-            # get a corresponding (empty) Channel for anonymous Feedback or None
-            feedback_channel: ZulipChannel | None = None
-            if opts.fb:
+            batch_results = await asyncio.gather(
+                *(
+                    self._create_channels(
+                        [(c_name, c_desc) for _, c_name, c_desc in items],
+                        list(principals),
+                        cleanup_opterations,
+                        invite_only,
+                    )
+                    for (principals, invite_only), items in batches.items()
+                ),
+                return_exceptions=True,
+            )
 
-                feedback_channel_name: str = name + " - Feedback"
-                feedback_channel_desc: list[str] = [
-                    f"Anonymous Channel for Feedback to {name}"
-                ]
-                if lan == "de":
-                    feedback_channel_desc = [f"Anonymer Kanal für Feedback zu {name}"]
-
-                f_ex = await self.client.get_channel_id_by_name(feedback_channel_name)
-
-                if f_ex is not None:
-                    await self.client.delete_channel(f_ex)
-
-                result_fb_s: dict[str, Any] = await self.client.add_subscriptions(
-                    channels=[
-                        {
-                            "name": feedback_channel_name,
-                            "description": " ".join(feedback_channel_desc),
-                        }
-                    ],
-                    principals=[sender.id, self.client.id],
+            created: dict[str, ZulipChannel] = {}
+            for items, batch_result in zip(batches.values(), batch_results):
+                if isinstance(batch_result, BaseException):
+                    raise batch_result
+                created.update(
+                    (key, channel) for (key, _, _), channel in zip(items, batch_result)
                 )
 
-                if result_fb_s["result"] != "success":
-                    raise DMError(result_fb_s["msg"])
-
-                feedback_channel = ZulipChannel(f"#**{feedback_channel_name}**")
-                await feedback_channel
-
-                cleanup_opterations.append(
-                    lambda: self.client.delete_channel(feedback_channel.id)
-                )
+            tutors_channel = cast(ZulipChannel, created.get("tutors", opts.tuts))
+            instructor_channel = cast(
+                ZulipChannel | None, created.get("instructors", opts.ins)
+            )
+            feedback_channel = created.get("feedback")
 
             channels = cast(ChannelGroup, channels)
 
@@ -992,11 +851,7 @@ class Course(PluginCommand, Plugin):
 
         except Exception as e:
             session.rollback()
-            for cleanup in cleanup_opterations:
-                if inspect.iscoroutinefunction(cleanup):
-                    await cleanup()
-                else:
-                    cleanup()
+            await Course._run_cleanups(cleanup_opterations)
             if isinstance(e, DMError):
                 raise e
 
@@ -1028,20 +883,22 @@ class Course(PluginCommand, Plugin):
         courseTutorChannel: ZulipChannel | None = None
         courseInstructorChannel: ZulipChannel | None = None
 
-        cleanup_opterations: list[
-            Callable[[], None]
-            | Callable[[], Coroutine[Any, Any, dict[str, Any]]]
-            | Callable[[], Coroutine[Any, Any, None]]
-        ] = []
+        cleanup_opterations: list[CleanupOperation] = []
+
+        # watches the exit reaction, started once the intro messages are sent
+        exit_task: asyncio.Task[tuple[bool, dict[str, Any]]] | None = None
 
         async def or_exit(coro: Coroutine[None, None, T]) -> T:
             task = asyncio.create_task(coro)
-            done, _ = await asyncio.wait(
-                [task, exit_task], return_when=asyncio.FIRST_COMPLETED
-            )
+            waiting: set[asyncio.Task[Any]] = {task}
+            if exit_task is not None:
+                waiting.add(exit_task)
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
             if exit_task in done:
+                # stop waiting for the answer, so the prompt does not outlive the wizard
+                task.cancel()
                 raise DMError("You have exited the wizard. Have a nice day :bothappy:")
-            return cast(T, done.pop().result())
+            return task.result()
 
         def exit_and_inform_on_error(client_response: dict[str, Any]) -> dict[str, Any]:
             if client_response["result"] != "success":
@@ -1058,7 +915,7 @@ class Course(PluginCommand, Plugin):
                 )
             )
             cleanup_opterations.append(
-                lambda m=result: self.client.delete_message(m["id"])
+                partial(self.client.delete_message, result["id"])
             )
             return result
 
@@ -1078,40 +935,52 @@ class Course(PluginCommand, Plugin):
             )
             return user_response
 
-        responses = [
-            await dm("Welcome to the Course Creation Wizard :bothappy:"),
-            await dm(
-                "You can always exit the wizard by reacting with :cross_mark: to this message. You can answer my questions by replying to me with the response or reacting to my questions. I will do my best to guide you through the process of configuring your Course."
-            ),
-            await dm(
-                cleandoc(
-                    """
-                                                                 Let's start by choosing a name for your new Course :bothappy:
-                                                                 
-                                                                 ```spoiler What is a short name of a Course?
-                                                                 The short name is a unique identifier for the Course without spaces or special characters.
-                                                                 This name will be used to associate Channels with the course. For example, if the course is called "Introduction to Computer Science", the short name could be `ICS` and the Announcements Channel would have the name `ICS - Announcements`.
-                                                                 ```
-                                                                 """
-                )
-            ),
-        ]
+        await dm("Welcome to the Course Creation Wizard :bothappy:")
+        exit_message = await dm(
+            "You can always exit the wizard by reacting with :cross_mark: to this message. You can answer my questions by replying to me with the response or reacting to my questions. I will do my best to guide you through the process of configuring your Course."
+        )
 
-        try:
+        async def add_exit_reaction() -> None:
             # wait for user client to process the messages so that the reactions can be added
             await asyncio.sleep(0.2)
             exit_and_inform_on_error(
                 await self.client.add_reaction(
-                    {"message_id": responses[1]["id"], "emoji_name": "cross_mark"}
+                    {"message_id": exit_message["id"], "emoji_name": "cross_mark"}
                 )
             )
 
+        try:
+            # the messages have to arrive in order, so only the exit reaction
+            # is added while the last one is sent
+            await asyncio.gather(
+                dm(
+                    cleandoc(
+                        """
+                                                                     Let's start by choosing a name for your new Course :bothappy:
+                                                                 
+                                                                     ```spoiler What is a short name of a Course?
+                                                                     The short name is a unique identifier for the Course without spaces or special characters.
+                                                                     This name will be used to associate Channels with the course. For example, if the course is called "Introduction to Computer Science", the short name could be `ICS` and the Announcements Channel would have the name `ICS - Announcements`.
+                                                                     ```
+                                                                     """
+                    )
+                ),
+                add_exit_reaction(),
+            )
+
             exit_task = asyncio.create_task(
                 UserInput.specific_reaction(
-                    responses[1]["id"], "cross_mark", timeout=120
+                    exit_message["id"], "cross_mark", timeout=120
                 )
             )
 
+            # checked against on every (wrong) input, so only fetch the names once;
+            # the unique constraint on CourseName still guards the final insert
+            cg_rows: list[tuple[str]] = session.query(ChannelGroup.ChannelGroupId).all()
+            chgs: list[str] = [cg_id for (cg_id,) in cg_rows]
+            name_rows: list[tuple[str]] = session.query(CourseDB.CourseName).all()
+            course_names: set[str] = {c_name for (c_name,) in name_rows}
+
             while True:
 
                 result = await short_text_input("What is the short name of the Course?")
@@ -1119,43 +988,34 @@ class Course(PluginCommand, Plugin):
                 if result is None:
                     await dm("Please provide a valid short name for the Course.")
                 else:
-                    c: CourseDB | None = (
-                        session.query(CourseDB)
-                        .filter(CourseDB.CourseName == result)
-                        .one_or_none()
-                    )
-                    if c is None:
+                    if result not in course_names:
                         courseName = result
-                        cg = (
-                            session.query(ChannelGroup)
-                            .filter(
-                                ChannelGroup.ChannelGroupId.like(courseName)
-                            )
-                            .all()
-                        )
+                        cg: list[str] = [
+                            cg_id
+                            for cg_id in chgs
+                            if cg_id.lower() == courseName.lower()
+                        ]
                         if cg:
                             if await confirm_input(
                                 cleandoc(
                                     f"""
                                     At least one Channelgroup with the name `{courseName}` already exists.
                                     Existing channel groups are:
-                                    {'\n'.join([' - ' + str(c.ChannelGroupId) for c in cg])}
+                                    {'\n'.join([' - ' + cg_id for cg_id in cg])}
                                     
                                     Should I delete them? (This is safe to to, if this channel group belongs to an old course)
                                     """
                                 )
                             ):
-                                for existing_channelgroup in cg:
-                                    await Channelgroup.delete_group_h(
-                                        session,
-                                        session.query(ChannelGroup)
-                                        .filter(
-                                            ChannelGroup.ChannelGroupId
-                                            == existing_channelgroup.ChannelGroupId
-                                        )
-                                        .one(),
-                                        self.client,
+                                for cg_id in cg:
+                                    existing_channelgroup = session.get(
+                                        ChannelGroup, cg_id
                                     )
+                                    if existing_channelgroup is not None:
+                                        await Channelgroup.delete_group_h(
+                                            session, existing_channelgroup, self.client
+                                        )
+                                    chgs.remove(cg_id)
                             else:
                                 continue
                         break
@@ -1206,9 +1066,9 @@ class Course(PluginCommand, Plugin):
                 for c in similar_chans:
                     await self.client.delete_channel(c.id)
 
-            chgs: list[str] = [
-                str(cg_id) for cg_id in session.query(ChannelGroup.ChannelGroupId).all()
-            ]
+            # only needed here, so keep it out of the plugin's import time
+            import difflib  # pylint: disable=import-outside-toplevel
+
             closest = difflib.get_close_matches(courseName, chgs)
             if closest:
                 server_response = await dm(
@@ -1223,18 +1083,12 @@ class Course(PluginCommand, Plugin):
                     )
                 )
                 if user_response == "trashcan":
-                    for existing_channelgroup_name in closest:
-                        await Channelgroup.delete_group_h(
-                            session,
-                            session.query(ChannelGroup)
-                            .filter(
-                                ChannelGroup.ChannelGroupId.like(
-                                    existing_channelgroup_name
-                                )
+                    for cg_id in closest:
+                        existing_channelgroup = session.get(ChannelGroup, cg_id)
+                        if existing_channelgroup is not None:
+                            await Channelgroup.delete_group_h(
+                                session, existing_channelgroup, self.client
                             )
-                            .one(),
-                            self.client,
-                        )
 
             await dm(
                 cleandoc(
@@ -1248,6 +1102,11 @@ class Course(PluginCommand, Plugin):
                 )
             )
 
+            emote_rows: list[tuple[str]] = session.query(
+                ChannelGroup.ChannelGroupEmote
+            ).all()
+            used_emotes: set[str] = {emote for (emote,) in emote_rows}
+
             while True:
 
                 sg_emoji = await short_text_input(
@@ -1262,12 +1121,7 @@ class Course(PluginCommand, Plugin):
                     await dm("Please provide a valid emoji.")
                     continue
 
-                sg = (
-                    session.query(ChannelGroup)
-                    .filter(ChannelGroup.ChannelGroupEmote == emote)
-                    .one_or_none()
-                )
-                if sg is None:
+                if emote not in used_emotes:
                     courseEmoji = emote
                     break
 
@@ -1280,24 +1134,34 @@ class Course(PluginCommand, Plugin):
                 session, courseName, courseEmoji, self.client
             )
             cleanup_opterations.append(
-                lambda s=courseChannels: Channelgroup.delete_group_h(
-                    session, s, self.client
-                )
+                partial(Channelgroup.delete_group_h, session, courseChannels, self.client)
             )
 
             # add default Channels
-            resultG = await confirm_input(
-                "Now you can add the default Channels to your course. Every course will have an Announcement-Channel, a Feedback-Channel and a channel for tutors either way. However, are might be a view other channels that could be benefitial for your course.\nDo you want to add a general Channel to your Course?"
-            )
-            resultO = await confirm_input(
-                "Do you want to add a Organization-Channel (in addition to the Announcement-Channel) to your Course?"
-            )
-            resultM = await confirm_input(
-                "Do you want to add a Memes-Channel to your Course?"
+            # ask for all optional default Channels with a single prompt
+            server_response = await dm(
+                cleandoc(
+                    """Now you can add the default Channels to your course. Every course will have an Announcement-Channel, a Feedback-Channel and a channel for tutors either way. However, are might be a view other channels that could be benefitial for your course.
+                    Which of the following Channels do you want to add to your Course? React with all that apply and confirm with :check:.
+                    :one: a general Channel
+                    :two: an Organization-Channel (in addition to the Announcement-Channel)
+                    :three: a Memes-Channel
+                    :four: a Channel for Tech-Support
+                    """
+                )
             )
-            resultT = await confirm_input(
-                "Do you want to add a Channel for Tech-Support to your Course?"
+            chosen_channels, _ = await or_exit(
+                UserInput.multi_choose(
+                    self.client,
+                    server_response["id"],
+                    ["one", "two", "three", "four"],
+                    timeout=60,
+                )
             )
+            resultG = "one" in chosen_channels
+            resultO = "two" in chosen_channels
+            resultM = "three" in chosen_channels
+            resultT = "four" in chosen_channels
             resultF = await confirm_input(
                 cleandoc(
                     """Do you want the Feedback-Channel of your Course to allow anonymous Feedback?
@@ -1317,7 +1181,7 @@ class Course(PluginCommand, Plugin):
                 raise DMError("Could not determine the language of the Course.")
 
             # wizard adds Feedback and Announcement per default to improve the communication between instructors and students (they have to be removed manually)
-            stand_chan_ids: list[int] = await Course.add_standard_channels(
+            stand_chans: list[ZulipChannel] = await Course.add_standard_channels(
                 client=self.client,
                 session=session,
                 name=courseName,
@@ -1333,29 +1197,32 @@ class Course(PluginCommand, Plugin):
                 t=resultT,
             )
 
-            for chan_id in stand_chan_ids:
+            for chan in stand_chans:
                 cleanup_opterations.append(
-                    lambda id=chan_id: self.client.delete_channel(id)
+                    partial(self.client.delete_channel, chan.id)
                 )
 
             async def wizard_create_usergroup(
-                group_type: str, group_type_de: str, create_channel: bool
-            ) -> tuple[UserGroup, ZulipChannel | None]:
+                group_type: str, create_channel: bool
+            ) -> tuple[UserGroup, tuple[str, str, list[int]] | None]:
+                """Create the Usergroup and return the spec of its Channel, if wanted."""
                 usergroup_name: str = f"{group_type}_{courseName}"
 
-                ug = (
+                ug: UserGroup | None = (
                     session.query(UserGroup)
                     .filter(UserGroup.GroupName == usergroup_name)
-                    .all()
+                    .one_or_none()
                 )
-                if ug:
-                    Usergroup.delete_group(session, ug[0])
+                if ug is not None:
+                    Usergroup.delete_group(session, ug)
 
                 ugdb = Usergroup.create_and_get_group(session, usergroup_name)
                 cleanup_opterations.append(
-                    lambda ug=ugdb: Usergroup.delete_group(session, ug)
+                    partial(Usergroup.delete_group, session, ugdb)
                 )
 
+                members: list[ZulipUser] = [sender]
+
                 if await confirm_input(
                     f"Do you already have a list of {group_type.capitalize()} (except from you) for your Course? If not, you can add them later with the command `course add_{group_type} {courseName} <{group_type.capitalize()}...>`. Note, that you do not have to add yourself to the {group_type.capitalize()} group."
                 ):
@@ -1367,38 +1234,52 @@ class Course(PluginCommand, Plugin):
                         if result2ct is None:
                             continue
 
-                        # parse Channel Names
-                        names = result2ct.split(",")
-
-                        for name in names:
-                            real_name = Regex.get_user_name(name)
-                            if real_name is None:
-                                await dm(f"Could not find a user with the name {name}.")
+                        # parse user mentions
+                        mentions: list[tuple[str, int | None]] = []
+                        not_found: list[str] = []
+                        for name in result2ct.split(","):
+                            mapping = Regex.get_user_name(name, get_user_id=True)
+                            if mapping is None:
+                                not_found.append(name.strip())
                                 continue
-                            try:
-                                user = ZulipUser(cast(str, real_name))
-                                await user
-                                Usergroup.add_user_to_group(session, user, ugdb)
-                            except Exception:
-                                await dm(f"Could not add a user with the name {name}.")
+                            mentions.append(cast(tuple[str, int | None], mapping))
+
+                        # only the ids are needed, resolve all missing ones in one request
+                        missing: list[str] = [
+                            uname for uname, uid in mentions if uid is None
+                        ]
+                        found: dict[str, int | None] = dict(
+                            zip(
+                                missing,
+                                await self.client.get_user_ids_by_names(
+                                    [f"@**{uname}**" for uname in missing]
+                                ),
+                            )
+                        )
+                        for uname, uid in mentions:
+                            if uid is None:
+                                uid = found[uname]
+                            if uid is None:
+                                not_found.append(f"@_**{uname}**")
                                 continue
+                            members.append(ZulipUser(uid, name=uname))
+
+                        # report all unknown names in one message
+                        if not_found:
+                            await dm(
+                                f"Could not find the following users: {', '.join(not_found)}."
+                            )
                         break
 
-                Usergroup.add_user_to_group(session, sender, ugdb)
+                Usergroup.add_users_to_group(session, members, ugdb)
 
                 if not create_channel:
                     return ugdb, None
 
                 # get a corresponding Channel
-                channel_name = f"{courseName} - {group_type.capitalize()}"
-                channel_desc = (
-                    f"Internal Channel for {courseName}-{group_type.capitalize()}"
+                channel_name, channel_desc = Course._channel_texts(
+                    courseLan, group_type, courseName
                 )
-                if courseLan == "de":
-                    channel_name = f"{courseName} - {group_type_de.capitalize()}"
-                    channel_desc = (
-                        f"Interner Kanal für {courseName}-{group_type_de.capitalize()}"
-                    )
 
                 chan_ex = await self.client.get_channel_id_by_name(channel_name)
                 while chan_ex is not None:
@@ -1426,30 +1307,10 @@ class Course(PluginCommand, Plugin):
                 user_ids = Usergroup.get_user_ids_for_group(session, ugdb)
                 user_ids.append(self.client.id)
 
-                exit_and_inform_on_error(
-                    await self.client.add_subscriptions(
-                        channels=[
-                            {
-                                "name": channel_name,
-                                "description": channel_desc,
-                            }
-                        ],
-                        principals=user_ids,
-                        invite_only=True,
-                        history_public_to_subscribers=True,
-                    )
-                )
+                return ugdb, (channel_name, channel_desc, user_ids)
 
-                chan = ZulipChannel(f"#**{channel_name}**")
-                await chan
-                cleanup_opterations.append(
-                    lambda chan=chan: self.client.delete_channel(chan.id)
-                )
-
-                return ugdb, chan
-
-            courseTutors, courseTutorChannel = await wizard_create_usergroup(
-                "tutors", "tutoren", True
+            courseTutors, tutor_spec = await wizard_create_usergroup(
+                "tutors", True
             )
 
             resultis = await confirm_input(
@@ -1461,14 +1322,43 @@ class Course(PluginCommand, Plugin):
                     "Ok, however, it is still necessary to add the Instructors to the Course, even if there is no Channel for them."
                 )
 
-            courseInstructors, courseInstructorChannel = await wizard_create_usergroup(
-                "instructors", "übungsleiter", resultis
+            courseInstructors, instructor_spec = await wizard_create_usergroup(
+                "instructors", resultis
+            )
+
+            async def create_group_channel(
+                spec: tuple[str, str, list[int]] | None,
+            ) -> ZulipChannel | None:
+                if spec is None:
+                    return None
+                return await self._create_channel(*spec, cleanup_opterations)
+
+            # The two Channels have different members, so they need a request each,
+            # but those can run at the same time. Let both finish before raising,
+            # so that the cleanup of the successful one is registered.
+            created = await asyncio.gather(
+                create_group_channel(tutor_spec),
+                create_group_channel(instructor_spec),
+                return_exceptions=True,
+            )
+            for res in created:
+                if isinstance(res, BaseException):
+                    raise res
+            courseTutorChannel, courseInstructorChannel = cast(
+                list[ZulipChannel | None], created
             )
 
+            # already resolved when the standard Channels were created
             courseFeedbackChannel: ZulipChannel | None = None
             if resultF:
-                courseFeedbackChannel = ZulipChannel(f"#**{courseName} - Feedback**")
-                await courseFeedbackChannel
+                courseFeedbackChannel = next(
+                    (c for c in stand_chans if c.name == f"{courseName} - Feedback"),
+                    None,
+                )
+                if courseFeedbackChannel is None:
+                    raise DMError(
+                        f"Could not find the Feedback-Channel of the Course `{courseName}` :botsweat:"
+                    )
 
             # create and add a Course to the DB
             course: CourseDB = CourseDB(
@@ -1499,7 +1389,7 @@ class Course(PluginCommand, Plugin):
                     if courseLan == "en"
                     else "Willkommen im Kurs"
                 ),
-                to=stand_chan_ids[0],
+                to=stand_chans[0].id,
             )
 
             response = await self.client.send_response(rspns)
@@ -1507,10 +1397,6 @@ class Course(PluginCommand, Plugin):
             if response["result"] != "success":
                 raise DMError("Could not send welcome message to the Course Channel.")
 
-            cleanup_opterations.append(
-                lambda: self.client.delete_message(response["id"])
-            )
-
             responseEmote = await self.client.send_response(
                 Response.build_reaction_from_id(response["id"], courseEmoji)
             )
@@ -1530,22 +1416,7 @@ class Course(PluginCommand, Plugin):
         except Exception as e:
             logging.exception(e)
             session.rollback()
-            cleanup_result: (
-                None | Coroutine[Any, Any, dict[str, Any]] | Coroutine[Any, Any, None]
-            )
-            op: (
-                Callable[[], None]
-                | Callable[[], Coroutine[Any, Any, dict[str, Any]]]
-                | Callable[[], Coroutine[Any, Any, None]]
-            )
-            for op in cleanup_opterations:
-                # TODO: too few arguments
-                cleanup_result = op()
-
-                if cleanup_result and inspect.isawaitable(cleanup_result):
-                    await cleanup_result
-                    # avoid rate limiting
-                    await asyncio.sleep(0.2)
+            await Course._run_cleanups(cleanup_opterations)
 
             if isinstance(e, DMError):
                 raise e
@@ -1559,6 +1430,11 @@ class Course(PluginCommand, Plugin):
                 f"Something went wrong when creating the Course `{courseName}` :botsweat:"
             ) from e
 
+        finally:
+            # the wizard is over, stop listening for the exit reaction
+            if exit_task is not None:
+                exit_task.cancel()
+
         yield DMResponse(f"Course `{courseName}` created :bothappy:")
 
     @command
@@ -1679,7 +1555,11 @@ class Course(PluginCommand, Plugin):
 
         ex: int | None = await self.client.get_channel_id_by_name(channel_name)
 
-        if ex is None:
+        channel: ZulipChannel
+        if ex is not None:
+            # name and id are known, no need to resolve the Channel again
+            channel = ZulipChannel(ID=ex, name=channel_name)
+        else:
             result_channel = await self.client.add_subscriptions(
                 channels=[
                     {
@@ -1693,8 +1573,8 @@ class Course(PluginCommand, Plugin):
             if result_channel["result"] != "success":
                 raise DMError(result_channel["msg"])
 
-        channel: ZulipChannel = ZulipChannel(f"#**{channel_name}**")
-        await channel
+            channel = ZulipChannel(f"#**{channel_name}**")
+            await channel
 
         Channelgroup.add_zulip_channels(session, [channel], chan_group)
         yield DMResponse(
@@ -1727,17 +1607,15 @@ class Course(PluginCommand, Plugin):
         """
         course: CourseDB = args.course
         u_group: ChannelGroup = Course.get_tutorgroup(course, session)
-        tutors: list[ZulipUser] = await Usergroup.get_users_for_group(session, u_group)
         t_chan: ZulipChannel = cast(ZulipChannel, course.TutorChannel)
         await t_chan
 
         new_tutors: list[ZulipUser] = args.tutors
-        to_add: list[int] = []
+        tutor_ids: set[int] = set(Usergroup.get_user_ids_for_group(session, u_group))
+        to_add: list[int] = [t.id for t in new_tutors if t.id not in tutor_ids]
 
-        for tutor in new_tutors:
-            if tutor not in tutors:
-                Usergroup.add_user_to_group(session, tutor, u_group)
-                to_add.append(tutor.id)
+        # one insert and commit for all new Tutors
+        Usergroup.add_users_to_group(session, new_tutors, u_group)
 
         resp = await self.client.add_subscriptions(
             channels=[{"name": t_chan.name}],
@@ -1777,15 +1655,13 @@ class Course(PluginCommand, Plugin):
         """
         course: CourseDB = args.course
         u_group: ChannelGroup = Course.get_instructorgroup(course, session)
-        insts: list[ZulipUser] = await Usergroup.get_users_for_group(session, u_group)
 
         new_insts: list[ZulipUser] = args.instructors
-        to_add: list[int] = []
+        ins_ids: set[int] = set(Usergroup.get_user_ids_for_group(session, u_group))
+        to_add: list[int] = [i.id for i in new_insts if i.id not in ins_ids]
 
-        for ins in new_insts:
-            if ins not in insts:
-                Usergroup.add_user_to_group(session, ins, u_group)
-                to_add.append(ins.id)
+        # one insert and commit for all new Instructors
+        Usergroup.add_users_to_group(session, new_insts, u_group)
 
         if course.InstructorChannel is not None:
             ins_chan: ZulipChannel = cast(ZulipChannel, course.InstructorChannel)
@@ -1898,11 +1774,7 @@ class Course(PluginCommand, Plugin):
         course: CourseDB = args.course
 
         if opts.c:
-            sg: ChannelGroup | None = (
-                session.query(ChannelGroup)
-                .filter(ChannelGroup.ChannelGroupId == course.Channels)
-                .first()
-            )
+            sg: ChannelGroup | None = course.channelgroup
             if sg is not None:
                 channels: list[ZulipChannel] = await Channelgroup.get_channels(
                     session, sg
@@ -1913,17 +1785,9 @@ class Course(PluginCommand, Plugin):
                     await self.client.delete_channel(s.id)
 
         if opts.t:
-            tutors: UserGroup | None = (
-                session.query(UserGroup)
-                .filter(UserGroup.GroupId == course.TutorsUserGroup)
-                .first()
-            )
+            tutors: UserGroup | None = session.get(UserGroup, course.TutorsUserGroup)
             if tutors is not None:
-                users: list[ZulipUser] = await Usergroup.get_users_for_group(
-                    session, tutors
-                )
-                for user in users:
-                    Usergroup.remove_user_from_group(session, user, tutors)
+                Usergroup.remove_all_users_from_group(session, tutors)
 
         yield DMResponse(f"Course `{course.CourseName}` cleared :bothappy:")
 
@@ -1975,28 +1839,20 @@ class Course(PluginCommand, Plugin):
 
         course: CourseDB = args.course
         c_name = str(course.CourseName)
-        channels_id = str(course.Channels)
+        # loaded together with the Course, keep it before the Course is deleted
+        sg: ChannelGroup | None = course.channelgroup
         tut_ug_id = int(course.TutorsUserGroup)
         ins_ug_id = int(course.InstructorsUserGroup)
 
+        # only the ids are needed, so the channels are not resolved via the API
         tut_s: ZulipChannel = cast(ZulipChannel, course.TutorChannel)
-        await tut_s
-
-        ins_s: ZulipChannel | None = None
-        if course.InstructorChannel is not None:
-            ins_s = cast(ZulipChannel, course.InstructorChannel)
-            await ins_s
+        ins_s: ZulipChannel | None = cast(ZulipChannel | None, course.InstructorChannel)
 
         if not opts.a and not opts.c and not opts.t and not opts.i and not opts.tuts and not opts.ins:
-            cask = await self.client.send_response(
-                Response.build_message(
-                    message,
-                    content=f"Do you really want to only delete the underlying Course structure? Other components might be difficult to delete afterwards. Did you mean `course delete -a {c_name}`? botsceptical:",
-                )
+            conf = await self._confirm(
+                message,
+                f"Do you really want to only delete the underlying Course structure? Other components might be difficult to delete afterwards. Did you mean `course delete -a {c_name}`? botsceptical:",
             )
-            if cask["result"] != "success":
-                raise DMError("Could not send message to user")
-            conf, _ = await UserInput.confirm(self.client, cask["id"], timeout=60)
             if not conf:
                 yield DMResponse(
                     "I will not delete the Course without your confirmation. See `help course` for further information."
@@ -2004,56 +1860,72 @@ class Course(PluginCommand, Plugin):
                 return
 
         try:
+            # Bulk delete on purpose: session.delete(course) would run the
+            # "all, delete-orphan" cascades and drop the channel group and
+            # usergroups even when the caller asked to keep them.
             session.query(CourseDB).filter(
                 CourseDB.CourseId == course.CourseId
-            ).delete()
+            ).delete(synchronize_session=False)
             session.commit()
         except sqlalchemy.exc.IntegrityError as e:
             session.rollback()
             raise DMError(f"Could not delete Course `{c_name}`.") from e
 
-        if opts.c or opts.a:
-            sg: ChannelGroup | None = (
-                session.query(ChannelGroup)
-                .filter(ChannelGroup.ChannelGroupId == channels_id)
-                .first()
-            )
+        # collect the channels of all selected components to delete them in one batch
+        to_delete: dict[int, ZulipChannel] = {}
 
-            if sg is not None:
-                strm: list[ZulipChannel] = await Channelgroup.get_channels(session, sg)
-                await Channelgroup.remove_zulip_channels(session, strm, sg)
+        if (opts.c or opts.a) and sg is not None:
+            # only the ids are needed to delete the channels, so they are not
+            # resolved up front; the members go with the group (ON DELETE CASCADE)
+            channel: ZulipChannel
+            for (channel,) in session.query(ChannelGroupMember.Channel).filter(
+                ChannelGroupMember.ChannelGroupId == sg.ChannelGroupId
+            ):
+                to_delete[channel.id] = channel
 
-                await Channelgroup.delete_group_h(session, sg, self.client)
+            await Channelgroup.delete_group_h(session, sg, self.client)
 
-                failed: list[str] = []
-                for s in strm:
-                    resp = await self.client.delete_channel(s.id)
-                    if resp["result"] != "success":
-                        failed.append(s.name)
+        if opts.tuts or opts.a:
+            to_delete[tut_s.id] = tut_s
 
-                yield DMResponse(f"Channels {', '.join(failed)} could not be deleted.")
+        if (opts.ins or opts.a) and ins_s is not None:
+            to_delete[ins_s.id] = ins_s
 
+        # the Usergroups are independent of each other, delete them with one commit
+        ug_ids: list[int] = []
         if opts.t or opts.a:
-            ugt: UserGroup | None = (
-                session.query(UserGroup).filter(UserGroup.GroupId == tut_ug_id).first()
-            )
-
-            if ugt is not None:
-                Usergroup.delete_group(session, ugt)
-
+            ug_ids.append(tut_ug_id)
         if opts.i or opts.a:
-            ugi: UserGroup | None = (
-                session.query(UserGroup).filter(UserGroup.GroupId == ins_ug_id).first()
-            )
+            ug_ids.append(ins_ug_id)
+        if ug_ids:
+            for ug in (
+                session.query(UserGroup).filter(UserGroup.GroupId.in_(ug_ids)).all()
+            ):
+                Usergroup.delete_group(session, ug, commit=False)
+            session.commit()
 
-            if ugi is not None:
-                Usergroup.delete_group(session, ugi)
+        if to_delete:
+            # delete concurrently, but bounded to stay friendly to the rate limit
+            semaphore = asyncio.Semaphore(8)
 
-        if opts.tuts or opts.a:
-            await self.client.delete_channel(tut_s.id)
+            async def delete_channel(channel: ZulipChannel) -> dict[str, Any]:
+                async with semaphore:
+                    return await self.client.delete_channel(channel.id)
 
-        if (opts.ins or opts.a) and ins_s is not None:
-            await self.client.delete_channel(ins_s.id)
+            strm: list[ZulipChannel] = list(to_delete.values())
+            responses = await asyncio.gather(*(delete_channel(s) for s in strm))
+            failed_chans: list[ZulipChannel] = [
+                s for s, resp in zip(strm, responses) if resp["result"] != "success"
+            ]
+
+            if failed_chans:
+                # the names are only needed for the error message
+                resolved = await asyncio.gather(*failed_chans, return_exceptions=True)
+                failed: list[str] = [
+                    str(s.id) if isinstance(res, BaseException) else s.name
+                    for s, res in zip(failed_chans, resolved)
+                ]
+                yield DMResponse(f"Channels {', '.join(failed)} could not be deleted.")
 
         await Channelgroup.update_announcement_messages(session, self.client)
 
@@ -2163,74 +2035,24 @@ class Course(PluginCommand, Plugin):
         fa: bool = True,
         m: bool = True,
         t: bool = True,
-    ) -> list[int]:
-        result: list[int] = []
+    ) -> list[ZulipChannel]:
 
         if principals is None:
             principals = [client.id]
         else:
             principals.append(client.id)
 
-        channels = []
-        for opt_abr, suffix_en, suffix_de, desc_en, desc_de in [
-            (
-                n,
-                "Announcements",
-                "Ankündigungen",
-                f"Welcome to the Channel for Announcements for {name}",
-                f"Willkommen im Zulip Kanal für Ankündigungen von {name}",
-            ),
-            (
-                g,
-                "General",
-                "Allgemein",
-                f"Welcome to the general Channel of {name}",
-                f"Willkommen im allgemeinen Zulip Kanal von dem Kurs {name}",
-            ),
-            (
-                o,
-                "Organization",
-                "Organisation",
-                f"Welcome to the organizational Channel of {name}",
-                f"Willkommen im Orga-Zulip Kanal von dem Kurs {name}",
-            ),
-            (
-                fn,
-                "Feedback",
-                "Feedback",
-                f"Welcome to the Channel for Feedback to {name}",
-                f"Willkommen im Feedback Zulip Kanal von dem Kurs {name}",
-            ),
-            (
-                fa,
-                "Feedback",
-                "Feedback",
-                f"Welcome to the Channel for Feedback to {name}, where you can send anonymous Feedback with the help of the TUM CS Bot.",
-                f"Willkommen im Feedback Zulip Kanal von dem Kurs {name}, in welchem du mit der Hilfe des TUM CS Bot anonymes Feedback senden kannst.",
-            ),
-            (
-                t,
-                "TechSupport",
-                "Technik",
-                f"Welcome to the Channel for Tech-Support in {name}",
-                f"Willkommen im Technik Zulip Kanal von {name}",
-            ),
-            (
-                m,
-                "Memes",
-                "Memes",
-                f"Welcome to the Channel for top-quality Memes of {name}",
-                f"Willkommen im Memes Zulip Kanal von {name}",
-            ),
-        ]:
-            if not opt_abr:
-                continue
-
-            suffix = suffix_en if lan == "en" else suffix_de
-            desc = desc_en if lan == "en" else desc_de
-            full_name = name + " - " + suffix
-
-            channels.append({"name": full_name, "description": desc})
+        # same order as STANDARD_CHANNEL_TEMPLATES
+        enabled: tuple[bool, ...] = (n, g, o, fn, fa, t, m)
+        idx: int = 0 if lan == "en" else 1
+        channels = [
+            {
+                "name": f"{name} - {suffixes[idx]}",
+                "description": descs[idx].format(name=name),
+            }
+            for (suffixes, descs), opt_abr in zip(STANDARD_CHANNEL_TEMPLATES, enabled)
+            if opt_abr
+        ]
 
         try:
             result2: dict[str, Any] = await client.add_subscriptions(
@@ -2242,35 +2064,46 @@ class Course(PluginCommand, Plugin):
 
             to_add = [ZulipChannel(f"#**{s['name']}**") for s in channels]
 
-            for s in to_add:
-                await s
-
-            Channelgroup.add_zulip_channels(session, to_add, sg)
-
-            result = [s.id for s in to_add]
+            # resolving a channel is a request to Zulip, so resolve all of them at once
+            await asyncio.gather(*to_add)
 
             if fa:
                 fb = next(s for s in to_add if f"{name} - Feedback" in s.name)
                 session.query(CourseDB).filter(CourseDB.CourseName == name).update(
                     {"FeedbackChannel": fb}
                 )
-                session.commit()
+
+            # commits the Feedback-Channel update together with the new members
+            Channelgroup.add_zulip_channels(session, to_add, sg)
 
             if m:
                 me = next(s for s in to_add if f"{name} - Memes" in s.name)
-                mcg: ChannelGroup | None = session.query(ChannelGroup).filter(ChannelGroup.ChannelGroupId == "Memes").one_or_none()
+                mcg: ChannelGroup | None = session.get(ChannelGroup, "Memes")
                 if mcg is not None:
                     Channelgroup.add_zulip_channels(session, [me], mcg)
 
-            return result
+            return to_add
 
         except Exception as e:
             session.rollback()
 
-            for c in channels:
-                cid = await client.get_channel_id_by_name(c["name"])
-                if cid is not None:
-                    await client.delete_channel(cid)
+            # One listing finds all of the new channels (the bot is subscribed
+            # to them) instead of a lookup per name; the deletions are independent.
+            names: set[str] = {c["name"].lower() for c in channels}
+            listing: dict[str, Any] = await client.get_channels()
+            ids: set[int | None]
+            if listing["result"] == "success":
+                ids = {
+                    c["stream_id"]
+                    for c in listing["streams"]
+                    if c["name"].lower() in names
+                }
+            else:
+                ids = set(await Course._probe_channels(client, *names))
+            await asyncio.gather(
+                *(client.delete_channel(cid) for cid in ids if cid is not None),
+                return_exceptions=True,
+            )
 
             raise DMError(
                 "Something went wrong when creating the default channels :botsad:"
@@ -2280,10 +2113,155 @@ class Course(PluginCommand, Plugin):
     #       HELPER METHODS
     # ========================================================================================================================
 
+    async def _create_channel(
+        self,
+        name: str,
+        description: str,
+        principals: list[int],
+        cleanup_opterations: list[CleanupOperation],
+        invite_only: bool = True,
+    ) -> ZulipChannel:
+        """
+        Create a Channel (private by default, e.g. for Tutors or Instructors) and register its deletion in the given cleanup operations.
+        """
+        channels: list[ZulipChannel] = await self._create_channels(
+            [(name, description)], principals, cleanup_opterations, invite_only
+        )
+        return channels[0]
+
+    async def _confirm(self, message: dict[str, Any], content: str) -> bool:
+        """
+        Ask the sender of `message` a yes/no question and wait for the answer.
+        """
+        result = await self.client.send_response(
+            Response.build_message(message, content=content)
+        )
+        if result["result"] != "success":
+            raise DMError("Could not send message to user")
+
+        confirmed, _ = await UserInput.confirm(self.client, result["id"], timeout=60)
+        return confirmed
+
+    async def _confirm_all(
+        self, message: dict[str, Any], contents: list[str]
+    ) -> int | None:
+        """
+        Ask several independent yes/no questions at once.
+
+        Returns the index of the first question the user declined, the others are withdrawn then, or None if all were confirmed.
+        """
+        tasks: list[asyncio.Task[bool]] = [
+            asyncio.create_task(self._confirm(message, content)) for content in contents
+        ]
+        try:
+            pending: set[asyncio.Task[bool]] = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                declined: list[int] = [
+                    tasks.index(task) for task in done if not task.result()
+                ]
+                if declined:
+                    return min(declined)
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _create_channels(
+        self,
+        specs: list[tuple[str, str]],
+        principals: list[int],
+        cleanup_opterations: list[CleanupOperation],
+        invite_only: bool = True,
+    ) -> list[ZulipChannel]:
+        """
+        Create several Channels with the same subscribers and privacy in a single request.
+
+        `specs` holds the name and description of every Channel. The deletion of each created Channel is registered in the given cleanup operations.
+        """
+        result: dict[str, Any] = await self.client.add_subscriptions(
+            channels=[{"name": name, "description": desc} for name, desc in specs],
+            principals=principals,
+            invite_only=invite_only,
+            history_public_to_subscribers=True,
+        )
+        if result["result"] != "success":
+            raise DMError(result["msg"])
+
+        channels: list[ZulipChannel] = [ZulipChannel(f"#**{name}**") for name, _ in specs]
+        resolved = await asyncio.gather(*channels, return_exceptions=True)
+
+        for channel, res in zip(channels, resolved):
+            if not isinstance(res, BaseException):
+                cleanup_opterations.append(
+                    partial(self.client.delete_channel, channel.id)
+                )
+        for res in resolved:
+            if isinstance(res, BaseException):
+                raise res
+
+        return channels
+
+    @staticmethod
+    async def _probe_channels(
+        client: AsyncClient, *names: str | None
+    ) -> list[int | None]:
+        """
+        Look up the ids of the given Channels concurrently, `None` names are skipped.
+        """
+
+        async def channel_id(channel_name: str | None) -> int | None:
+            if channel_name is None:
+                return None
+            return await client.get_channel_id_by_name(channel_name)
+
+        return list(await asyncio.gather(*(channel_id(n) for n in names)))
+
+    @staticmethod
+    async def _run_cleanups(cleanup_opterations: list[CleanupOperation]) -> None:
+        """
+        Undo a partially created Course.
+
+        Synchronous cleanups (database rollbacks) run in order, the awaitables
+        returned by the others (Zulip API calls) are awaited concurrently.
+        Failures are logged so that one failing cleanup does not prevent the rest.
+        """
+        pending: list[Awaitable[Any]] = []
+        for cleanup in cleanup_opterations:
+            try:
+                result: Awaitable[Any] | None = cleanup()
+            except Exception as e:
+                logging.exception(e)
+                continue
+            if result is not None:
+                pending.append(result)
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(8)
+
+        async def bounded(awaitable: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await awaitable
+
+        for outcome in await asyncio.gather(
+            *(bounded(a) for a in pending), return_exceptions=True
+        ):
+            if isinstance(outcome, BaseException):
+                logging.error("Cleanup operation failed: %s", outcome)
+
+    @staticmethod
+    def _channel_texts(lan: str, role: str, name: str) -> tuple[str, str]:
+        """
+        Get the name and description of an internal Channel (tutors, instructors or feedback) of a Course.
+        """
+        name_tpl, desc_tpl = CHANNEL_TEMPLATES[(lan, role)]
+        return name_tpl.format(name=name), desc_tpl.format(name=name)
+
     @staticmethod
     def get_course_by_id(Id: int, session: Session) -> CourseDB:
-        result: CourseDB | None = None
-        result = session.query(CourseDB).filter(CourseDB.CourseId == Id).one_or_none()
+        result: CourseDB | None = session.get(CourseDB, Id)
 
         if result:
             return result
@@ -2306,15 +2284,58 @@ class Course(PluginCommand, Plugin):
             f"Uuups, it looks like i could not find any Course associated with `{name}` :botsceptical:"
         )
 
+    @staticmethod
+    def _find_existing(
+        session: Session,
+        name: str | None = None,
+        emoji: str | None = None,
+        usergroups: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Check with a single query which of the given Course name, Channelgroup emoji and Usergroup names are already in use.
+
+        Returns a dict mapping "course", "channelgroup" and the keys of `usergroups` to the id of the existing entry.
+        """
+        stmts: list[Select[Any, Any]] = []
+        if name is not None:
+            stmts.append(
+                select(
+                    literal("course").label("kind"), CourseDB.CourseId.label("id")
+                ).where(CourseDB.CourseName == name)
+            )
+        if emoji is not None:
+            stmts.append(
+                select(
+                    literal("channelgroup"), ChannelGroup.ChannelGroupId
+                ).where(ChannelGroup.ChannelGroupEmote == emoji)
+            )
+        for kind, group_name in (usergroups or {}).items():
+            stmts.append(
+                select(literal(kind), UserGroup.GroupId).where(
+                    UserGroup.GroupName == group_name
+                )
+            )
+
+        if not stmts:
+            return {}
+
+        return {row.kind: row.id for row in session.execute(union_all(*stmts))}
+
     @staticmethod
     def get_channelgroup(course: CourseDB, session: Session) -> ChannelGroup:
         """
         Get the ChannelGroup of a given Course.
         """
-        ID = str(course.Channels)
-        return (
-            session.query(ChannelGroup).filter(ChannelGroup.ChannelGroupId == ID).one()
-        )
+        # already loaded together with the Course (lazy="selectin")
+        sg: ChannelGroup | None = course.channelgroup
+        if sg is None:
+            ID = str(course.Channels)
+            return (
+                session.query(ChannelGroup)
+                .filter(ChannelGroup.ChannelGroupId == ID)
+                .one()
+            )
+        return sg
 
     @staticmethod
     def get_emoji(course: CourseDB, session: Session) -> str:
@@ -2329,32 +2350,72 @@ class Course(PluginCommand, Plugin):
         """
         Get the Tutor-UserGroup of a given Course.
         """
-        ID = int(course.TutorsUserGroup)
-        return session.query(UserGroup).filter(UserGroup.GroupId == ID).one()
+        ug: UserGroup | None = session.get(UserGroup, course.TutorsUserGroup)
+        if ug is None:
+            raise DMError(
+                f"Uuups, it looks like i could not find the Tutors of `{course.CourseName}` :botsceptical:"
+            )
+        return ug
+
+    @staticmethod
+    def get_usergroups(course: CourseDB, session: Session) -> tuple[UserGroup, UserGroup]:
+        """
+        Get the Tutor- and Instructor-UserGroup of a given Course with a single query.
+        """
+        loaded: list[UserGroup] = (
+            session.query(UserGroup)
+            .filter(
+                UserGroup.GroupId.in_(
+                    [course.TutorsUserGroup, course.InstructorsUserGroup]
+                )
+            )
+            .all()
+        )
+        by_id: dict[int, UserGroup] = {int(g.GroupId): g for g in loaded}
+
+        tutors: UserGroup | None = by_id.get(int(course.TutorsUserGroup))
+        if tutors is None:
+            raise DMError(
+                f"Uuups, it looks like i could not find the Tutors of `{course.CourseName}` :botsceptical:"
+            )
+        instructors: UserGroup | None = by_id.get(int(course.InstructorsUserGroup))
+        if instructors is None:
+            raise DMError(
+                f"Uuups, it looks like i could not find the Instructors of `{course.CourseName}` :botsceptical:"
+            )
+        return tutors, instructors
 
     @staticmethod
     async def get_tutors(course: CourseDB, session: Session) -> list[ZulipUser]:
         """
         Get the Tutors of a Course a list of ZulipUsers.
         """
-        ug: UserGroup = Course.get_tutorgroup(course, session)
-        return await Usergroup.get_users_for_group(session, ug)
+        # the members reference the group by the id the Course already holds
+        return await Usergroup.get_users_for_group_id(
+            session, int(course.TutorsUserGroup)
+        )
 
     @staticmethod
     def get_instructorgroup(course: CourseDB, session: Session) -> UserGroup:
         """
-        Get the Tutor-UserGroup of a given Course.
+        Get the Instructor-UserGroup of a given Course.
         """
-        ID = int(course.InstructorsUserGroup)
-        return session.query(UserGroup).filter(UserGroup.GroupId == ID).one()
+        ug: UserGroup | None = session.get(UserGroup, course.InstructorsUserGroup)
+        if ug is None:
+            raise DMError(
+                f"Uuups, it looks like i could not find the Instructors of `{course.CourseName}` :botsceptical:"
+            )
+        return ug
 
     @staticmethod
     async def get_instructors(course: CourseDB, session: Session) -> list[ZulipUser]:
         """
         Get the Tutors of a Course a list of ZulipUsers.
         """
-        ug: UserGroup = Course.get_instructorgroup(course, session)
-        return await Usergroup.get_users_for_group(session, ug)
+        # the members reference the group by the id the Course already holds
+        return await Usergroup.get_users_for_group_id(
+            session, int(course.InstructorsUserGroup)
+        )
 
     @staticmethod
     async def get_channels(course: CourseDB, session: Session) -> list[ZulipChannel]:
@@ -2373,6 +2434,35 @@ class Course(PluginCommand, Plugin):
         sg: ChannelGroup = Course.get_channelgroup(course, session)
         return await Channelgroup.get_channel_names(session, client, [sg])
 
+    @staticmethod
+    def _swap_group(  # pylint: disable=too-many-arguments
+        course: CourseDB,
+        session: Session,
+        column: InstrumentedAttribute[Any],
+        new_id: int | str,
+        group_pk: InstrumentedAttribute[Any],
+        *,
+        error: str,
+    ) -> None:
+        """
+        Point `column` of a given Course to another group and delete the group it replaced.
+
+        The old id is read from the already loaded Course, so the swap is one
+        UPDATE and one DELETE in a single transaction.
+        """
+        old_id = getattr(course, column.key)
+        try:
+            session.execute(
+                update(CourseDB)
+                .where(CourseDB.CourseId == course.CourseId)
+                .values({column: new_id})
+            )
+            session.execute(delete(group_pk.class_).where(group_pk == old_id))
+            session.commit()
+        except sqlalchemy.exc.IntegrityError as e:
+            session.rollback()
+            raise DMError(error) from e
+
     @staticmethod
     def _update_channelgroup(
         course: CourseDB, session: Session, group: ChannelGroup
@@ -2380,24 +2470,17 @@ class Course(PluginCommand, Plugin):
         """
         Set the ChannelGroup of a given Course.
         """
-        oldSG: ChannelGroup = Course.get_channelgroup(course, session)
-        if oldSG == group:
+        if course.Channels == group.ChannelGroupId:
             raise DMError("The given Channelgroup is already set for this course.")
 
-        stmt = (
-            update(CourseDB)
-            .where(CourseDB.CourseId == course.CourseId)
-            .values(Channels=group)
+        Course._swap_group(
+            course,
+            session,
+            CourseDB.Channels,
+            str(group.ChannelGroupId),
+            ChannelGroup.ChannelGroupId,
+            error="Could not update Channelgroup :botsad:",
         )
-        try:
-            session.execute(stmt)
-            session.query(ChannelGroup).filter(
-                ChannelGroup.ChannelGroupId == oldSG.ChannelGroupId
-            ).delete()
-            session.commit()
-        except sqlalchemy.exc.IntegrityError as e:
-            session.rollback()
-            raise DMError("Could not update Channelgroup :botsad:") from e
 
     @staticmethod
     def _update_tutorgroup(
@@ -2406,50 +2489,40 @@ class Course(PluginCommand, Plugin):
         """
         Set the Tutor-UserGroup of a given Course.
         """
-        oldTG: UserGroup = Course.get_tutorgroup(course, session)
-        if oldTG == group:
+        if course.TutorsUserGroup == group.GroupId:
             raise DMError(
                 "The given Usergroup is already set as Tutorgroup for this course."
             )
 
-        stmt = (
-            update(CourseDB)
-            .where(CourseDB.CourseId == course.CourseId)
-            .values(TutorsUserGroup=group.GroupId)
+        Course._swap_group(
+            course,
+            session,
+            CourseDB.TutorsUserGroup,
+            int(group.GroupId),
+            UserGroup.GroupId,
+            error="Could not update Tutors :botsad:",
         )
-        try:
-            session.execute(stmt)
-            session.query(UserGroup).filter(UserGroup.GroupId == oldTG.GroupId).delete()
-            session.commit()
-        except sqlalchemy.exc.IntegrityError as e:
-            session.rollback()
-            raise DMError("Could not update Tutors :botsad:") from e
 
     @staticmethod
     def _update_instructorgroup(
         course: CourseDB, session: Session, group: UserGroup
     ) -> None:
         """
-        Set the Tutor-UserGroup of a given Course.
+        Set the Instructor-UserGroup of a given Course.
         """
-        oldIG: UserGroup = Course.get_instructorgroup(course, session)
-        if oldIG == group:
+        if course.InstructorsUserGroup == group.GroupId:
             raise DMError(
                 "The given Usergroup is already set as Instructorgroup for this course."
             )
 
-        stmt = (
-            update(CourseDB)
-            .where(CourseDB.CourseId == course.CourseId)
-            .values(InstructorsUserGroup=group)
+        Course._swap_group(
+            course,
+            session,
+            CourseDB.InstructorsUserGroup,
+            int(group.GroupId),
+            UserGroup.GroupId,
+            error="Could not update Instructors :botsad:",
         )
-        try:
-            session.execute(stmt)
-            session.query(UserGroup).filter(UserGroup.GroupId == oldIG.GroupId).delete()
-            session.commit()
-        except sqlalchemy.exc.IntegrityError as e:
-            session.rollback()
-            raise DMError("Could not update Instructors :botsad:") from e
 
     @staticmethod
     async def _update_tutorchannel(
@@ -2458,9 +2531,9 @@ class Course(PluginCommand, Plugin):
         """
         Set the Tutor-Channel of a given Course.
         """
+        # the id is known from the database, no need to resolve the name
         oldTS = cast(ZulipChannel, course.TutorChannel)
-        await oldTS
-        if oldTS == channel:
+        if oldTS.id == channel.id:
             raise DMError(
                 "The given Channel is already set as Tutor-Channel for this course."
             )
@@ -2490,9 +2563,8 @@ class Course(PluginCommand, Plugin):
 
         if course.InstructorChannel is not None:
             oldIS = cast(ZulipChannel, course.InstructorChannel)
-            await oldIS
 
-            if oldIS == channel:
+            if oldIS.id == channel.id:
                 raise DMError(
                     "The given Channel is already set as Instructor-Channel for this course."
                 )
@@ -2522,30 +2594,50 @@ class Course(PluginCommand, Plugin):
         """
         chan_group: ChannelGroup = Course.get_channelgroup(course, session)
         chan_group_name: str = str(chan_group.ChannelGroupId)
-        channels: list[ZulipChannel] = await Course.get_channels(
-            session=session, course=course
-        )
-        channel_names: list[str] = [c.mention for c in channels]
         emoji: str = Course.get_emoji(course, session)
 
-        tutors_ug: UserGroup = Course.get_tutorgroup(course, session)
-        tutors: list[ZulipUser] = await Course.get_tutors(course, session)
+        tutors_ug, instructors_ug = Course.get_usergroups(course, session)
+        # one query for the members of both groups
+        member_ids: dict[int, list[int]] = Usergroup.get_user_ids_for_groups(
+            session, [tutors_ug, instructors_ug]
+        )
+        tutors: list[ZulipUser] = [
+            ZulipUser(uid) for uid in member_ids[int(tutors_ug.GroupId)]
+        ]
+        instructors: list[ZulipUser] = [
+            ZulipUser(uid) for uid in member_ids[int(instructors_ug.GroupId)]
+        ]
         tutor_channel: ZulipChannel = cast(ZulipChannel, course.TutorChannel)
-        await tutor_channel
+        instructor_channel: ZulipChannel | None = cast(
+            ZulipChannel | None, course.InstructorChannel
+        )
+        feedback_chan: ZulipChannel | None = cast(
+            ZulipChannel | None, course.FeedbackChannel
+        )
 
-        instructors_ug: UserGroup = Course.get_instructorgroup(course, session)
-        instructors: list[ZulipUser] = await Course.get_instructors(course, session)
+        # every user and Channel is resolved with a request to Zulip,
+        # none of them depends on another, so resolve all of them at once
+        channels_task: asyncio.Task[list[ZulipChannel]] = asyncio.create_task(
+            Course.get_channels(session=session, course=course)
+        )
+        await asyncio.gather(
+            channels_task,
+            *tutors,
+            *instructors,
+            *(
+                c
+                for c in (tutor_channel, instructor_channel, feedback_chan)
+                if c is not None
+            ),
+        )
+        channel_names: list[str] = [c.mention for c in channels_task.result()]
 
         instructor_channel_name = "-"
-        if course.InstructorChannel is not None:
-            instructor_channel = cast(ZulipChannel, course.InstructorChannel)
-            await instructor_channel
+        if instructor_channel is not None:
             instructor_channel_name = instructor_channel.mention
 
         feedback_channel_name = "-"
-        if course.FeedbackChannel is not None:
-            feedback_chan = cast(ZulipChannel, course.FeedbackChannel)
-            await feedback_chan
+        if feedback_chan is not None:
             feedback_channel_name = feedback_chan.mention
 
         lan: str = ":flag_germany:"
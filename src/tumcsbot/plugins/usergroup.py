@@ -12,9 +12,11 @@ change the alert words and specify the emojis to use for the reactions.
 
 # TODO: replacement for zulip usergroups. Replace as soon as api allows bot requests for usergroups
 
-from typing import Any, AsyncGenerator, cast
+import asyncio
+from typing import Any, AsyncGenerator
 from sqlalchemy import Column, Integer, String, ForeignKey
 import sqlalchemy
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import relationship, Mapped
 from sqlalchemy.ext.hybrid import hybrid_property
 import yaml
@@ -340,10 +342,9 @@ class Usergroup(PluginCommand, Plugin):
         Returns:
             None
         """
-        if (
-            session.query(UserGroup).filter(UserGroup.GroupName == name).first()
-            is not None
-        ):
+        if session.query(
+            session.query(UserGroup.GroupId).filter(UserGroup.GroupName == name).exists()
+        ).scalar():
             raise DMError(f"Group '{name}' already exists")
 
         group = UserGroup(GroupName=name)
@@ -355,14 +356,16 @@ class Usergroup(PluginCommand, Plugin):
             raise DMError(f"Could not create group '{name}'. {str(e)}") from e
 
     @staticmethod
-    def create_and_get_group(session: Session, name: str) -> UserGroup:
+    def create_and_get_group(
+        session: Session, name: str, commit: bool = True
+    ) -> UserGroup:
         """
         Create a new user group.
 
         Args:
             session: The database session.
             name: The name of the group.
-            description: The description of the group.
+            commit: Commit the new group, otherwise only flush it so that the caller can commit several changes at once.
 
         Raises:
             DMError: If the group creation fails.
@@ -370,16 +373,18 @@ class Usergroup(PluginCommand, Plugin):
         Returns:
             Usergroup
         """
-        if (
-            session.query(UserGroup).filter(UserGroup.GroupName == name).first()
-            is not None
-        ):
+        if session.query(
+            session.query(UserGroup.GroupId).filter(UserGroup.GroupName == name).exists()
+        ).scalar():
             raise DMError(f"Group '{name}' already exists")
 
         group = UserGroup(GroupName=name)
         try:
             session.add(group)
-            session.commit()
+            if commit:
+                session.commit()
+            else:
+                session.flush()
         except sqlalchemy.exc.IntegrityError as e:
             session.rollback()
             raise DMError(f"Could not create group '{name}'. {str(e)}") from e
@@ -387,13 +392,14 @@ class Usergroup(PluginCommand, Plugin):
         return group
 
     @staticmethod
-    def delete_group(session: Session, group: UserGroup) -> None:
+    def delete_group(session: Session, group: UserGroup, commit: bool = True) -> None:
         """
         Delete a user group.
 
         Args:
             session: The database session.
             group: The group to delete.
+            commit: Commit the deletion, otherwise leave it to the caller.
 
         Raises:
             DMError: If the group deletion fails.
@@ -403,7 +409,8 @@ class Usergroup(PluginCommand, Plugin):
         """
         try:
             session.query(UserGroup).filter(UserGroup.GroupId == group.GroupId).delete()
-            session.commit()
+            if commit:
+                session.commit()
         except sqlalchemy.exc.IntegrityError as e:
             session.rollback()
             raise DMError(
@@ -433,6 +440,22 @@ class Usergroup(PluginCommand, Plugin):
                 f"Could not remove {user.mention_silent} from usergroup '{group.name}'."
             ) from e
 
+    @staticmethod
+    def remove_all_users_from_group(session: Session, group: UserGroup) -> None:
+        """
+        Remove every member of a user group with a single DELETE.
+        """
+        try:
+            session.query(UserGroupMember).filter(
+                UserGroupMember.GroupId == group.GroupId
+            ).delete(synchronize_session=False)
+            session.commit()
+        except sqlalchemy.exc.IntegrityError as e:
+            session.rollback()
+            raise DMError(
+                f"Could not remove the users from usergroup '{group.GroupName}'."
+            ) from e
+
     @staticmethod
     def add_user_to_group(session: Session, user: ZulipUser, group: UserGroup) -> None:
         user_ids: list[int] = Usergroup.get_user_ids_for_group(session, group)
@@ -451,6 +474,41 @@ class Usergroup(PluginCommand, Plugin):
                 f"Could not add {user.mention_silent} to usergroup '{group.GroupName}'."
             ) from e
 
+    @staticmethod
+    def add_users_to_group(
+        session: Session, users: list[ZulipUser], group: UserGroup
+    ) -> None:
+        """
+        Add several users to a user group with a single commit.
+
+        Args:
+            session: The database session.
+            users: The users to add. Users already in the group are skipped.
+            group: The group to add the users to.
+
+        Raises:
+            DMError: If the users could not be added.
+
+        Returns:
+            None
+        """
+        rows: list[dict[str, Any]] = [
+            {"GroupId": group.GroupId, "User": user}
+            for user in {user.id: user for user in users}.values()
+        ]
+        try:
+            if rows:
+                # one INSERT for all users, existing members are skipped by the database
+                session.execute(
+                    sqlite_insert(UserGroupMember).on_conflict_do_nothing(), rows
+                )
+            session.commit()
+        except sqlalchemy.exc.IntegrityError as e:
+            session.rollback()
+            raise DMError(
+                f"Could not add users to usergroup '{group.GroupName}'."
+            ) from e
+
     @staticmethod
     def get_groups_for_user(session: Session, user: ZulipUser) -> list[UserGroup]:
         return (
@@ -471,15 +529,37 @@ class Usergroup(PluginCommand, Plugin):
             users.append(s.User.id)
         return users
 
+    @staticmethod
+    def get_user_ids_for_groups(
+        session: Session, groups: list[UserGroup]
+    ) -> dict[int, list[int]]:
+        """
+        Get the user ids of several groups with a single query, keyed by GroupId.
+        """
+        users: dict[int, list[int]] = {int(group.GroupId): [] for group in groups}
+        group_id: int
+        user: ZulipUser
+        for group_id, user in session.query(
+            UserGroupMember.GroupId, UserGroupMember.User
+        ).filter(UserGroupMember.GroupId.in_(list(users))):
+            users[group_id].append(user.id)
+        return users
+
     @staticmethod
     async def get_users_for_group(session: Session, group: UserGroup) -> list[ZulipUser]:
-        users: list[ZulipUser] = []
-        for s in (
-            session.query(UserGroupMember)
-            .filter(UserGroupMember.GroupId == group.GroupId)
+        return await Usergroup.get_users_for_group_id(session, int(group.GroupId))
+
+    @staticmethod
+    async def get_users_for_group_id(session: Session, group_id: int) -> list[ZulipUser]:
+        """
+        Get the members of a group by its id, without loading the group itself.
+        """
+        rows: list[tuple[ZulipUser]] = (
+            session.query(UserGroupMember.User)
+            .filter(UserGroupMember.GroupId == group_id)
             .all()
-        ):
-            u = cast(ZulipUser, s.User)
-            await u
-            users.append(u)
+        )
+        users: list[ZulipUser] = [user for (user,) in rows]
+        # Resolving a user is a request to Zulip, so resolve all of them at once.
+        await asyncio.gather(*users)
         return users
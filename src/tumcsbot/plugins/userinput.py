@@ -144,6 +144,55 @@ class UserInput(Plugin):
                     {"message_id": message_id, "emoji_name": emote}
                 )
 
+    @classmethod
+    async def multi_choose(
+        cls,
+        client: AsyncClient,
+        message_id: int,
+        emotes_to_choose: list[str],
+        timeout: int = 10,
+        done_emote: str = "check",
+    ) -> tuple[set[str], dict[str, Any]]:
+        """Ask the user to pick any number of options at once.
+
+        The user reacts with all the emotes they want and finishes with
+        `done_emote`. On timeout, the emotes picked so far are returned.
+        """
+
+        q: asyncio.Queue[dict[str, Any]] = asyncio.Queue(1)
+        cls.pending_inputs[message_id] = q
+
+        # wait for UI to be ready, if we send instantly, the reaction might not be registered
+        await asyncio.sleep(0.5)
+
+        all_emotes: list[str] = [*emotes_to_choose, done_emote]
+        for emote in all_emotes:
+            result = await client.send_response(
+                Response.build_reaction({"id": message_id}, emote)
+            )
+            if result["result"] != "success":
+                logging.error(result)
+                raise Exception(f"Could not send reaction to user: {emote}")
+
+        chosen: set[str] = set()
+        try:
+            while True:
+                reaction = await cls._wait_for_queue(q, timeout)
+                q.task_done()
+                picked: str | None = reaction.get("emoji_name")
+                if picked == done_emote:
+                    return chosen, reaction
+                if picked in emotes_to_choose:
+                    chosen.add(picked)
+        except asyncio.TimeoutError:
+            return chosen, {}
+        finally:
+            del cls.pending_inputs[message_id]
+            for emote in all_emotes:
+                await client.remove_reaction(
+                    {"message_id": message_id, "emoji_name": emote}
+                )
+
     @classmethod
     async def reaction(
         cls, message_id: int, timeout: int = 10
@@ -161,6 +210,8 @@ class UserInput(Plugin):
             return response["emoji_name"], response
         except asyncio.TimeoutError:
             return None, {}
+        finally:
+            del cls.pending_inputs[message_id]
 
     @classmethod
     async def specific_reaction(